@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark the read backends of the EAM reader plugin on compressed files.
+
+Compares slice reads of a deflated netCDF4/HDF5 variable through netCDF4,
+which inflates the chunks on a single core, against the chunk backend of
+EAMSliceSource, which decompresses the chunks of a slice on a thread pool.
+Requires h5py.
+
+A synthetic EAM-like history file is generated unless one is provided.
+
+Usage:
+    pvpython scripts/benchmark_chunk_reads.py
+    pvpython scripts/benchmark_chunk_reads.py --ncol 86400 --nlev 72 --threads 8
+    pvpython scripts/benchmark_chunk_reads.py --file eam.h0.nc --variable T
+"""
+
+import argparse
+import importlib.util
+import os
+import tempfile
+import time
+
+import netCDF4
+import numpy as np
+
+PLUGIN = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "src",
+    "e3sm_quickview",
+    "plugins",
+    "eam_reader.py",
+)
+
+
+def load_reader_module():
+    spec = importlib.util.spec_from_file_location("eam_reader", PLUGIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def create_synthetic_file(path, ncol, nlev, ntime, chunk_ncol):
+    with netCDF4.Dataset(path, "w", format="NETCDF4") as ds:
+        ds.createDimension("time", None)
+        ds.createDimension("lev", nlev)
+        ds.createDimension("ncol", ncol)
+        time_var = ds.createVariable("time", "f8", ("time",))
+        var = ds.createVariable(
+            "T",
+            "f4",
+            ("time", "lev", "ncol"),
+            zlib=True,
+            complevel=4,
+            shuffle=True,
+            chunksizes=(1, 1, min(chunk_ncol, ncol)),
+            fill_value=np.float32(1e20),
+        )
+        # Smooth fields compress like model output, white noise would not
+        x = np.linspace(0, 8 * np.pi, ncol, dtype=np.float32)
+        for t in range(ntime):
+            time_var[t] = t
+            for k in range(nlev):
+                var[t, k] = 250 + 30 * np.sin(x + 0.1 * k + 0.5 * t)
+
+
+def measure(label, fn, slices, reference=None):
+    start = time.perf_counter()
+    for t, k in slices:
+        data = fn(t, k)
+    elapsed = time.perf_counter() - start
+    if reference is not None:
+        assert np.array_equal(data, reference), f"{label} returned different data"
+    print(f"{label:>16} | {1000 * elapsed / len(slices):10.2f} ms/slice")
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--file", help="existing compressed EAM history file")
+    parser.add_argument("--variable", default="T", help="3D variable to slice")
+    parser.add_argument("--ncol", type=int, default=86400)
+    parser.add_argument("--nlev", type=int, default=72)
+    parser.add_argument("--ntime", type=int, default=4)
+    parser.add_argument("--chunk-ncol", type=int, default=4096)
+    parser.add_argument("--threads", type=int, default=os.cpu_count())
+    parser.add_argument("--slices", type=int, default=20)
+    args = parser.parse_args()
+
+    eam_reader = load_reader_module()
+    if eam_reader.h5py is None:
+        parser.error("h5py is required by the chunk backend")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = os.path.join(tmp, "synthetic.eam.h0.nc")
+            create_synthetic_file(
+                path, args.ncol, args.nlev, args.ntime, args.chunk_ncol
+            )
+
+        with netCDF4.Dataset(path, "r") as ds:
+            ds.set_auto_mask(False)
+            variable = ds[args.variable]
+            varmeta = eam_reader.VarMeta(args.variable, variable)
+            shape = dict(zip(variable.dimensions, variable.shape))
+            ntime = shape["time"]
+            nlev = shape.get("lev", shape.get("ilev", 1))
+            print(
+                f"{path} : {args.variable}{variable.dimensions} "
+                f"chunks={variable.chunking()} filters={variable.filters()}"
+            )
+
+            # Distinct slices, so that the netCDF4 chunk cache does not hide
+            # the decompression cost
+            rng = np.random.default_rng(0)
+            picks = rng.permutation(ntime * nlev)[: args.slices]
+            slices = [(int(i) // nlev, int(i) % nlev) for i in picks]
+
+            reader = eam_reader.EAMSliceSource()
+            reference = measure(
+                "netCDF4",
+                lambda t, k: reader._read_hyperslab(ds, varmeta, t, k),
+                slices,
+            )
+            for threads in sorted({1, args.threads}):
+                series = eam_reader.FileSeries(path, decompress_threads=threads)
+                chunked = series.open(path)
+
+                def read(t, k, chunked=chunked):
+                    return reader._read_hyperslab(chunked, varmeta, t, k)
+
+                measure(f"chunks x{threads}", read, slices, reference)
+                series.close()
+
+
+if __name__ == "__main__":
+    main()
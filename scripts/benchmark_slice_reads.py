@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark slice reads of the EAM reader plugin.
+
+Compares the legacy access pattern (load the whole variable, then keep a
+single (time, lev) slice) against the hyperslab reads done by
+EAMSliceSource. For each strategy the script reports the size of the
+requested hyperslab (computed from its shape), the bytes actually read from
+the file and from the storage (Linux only, from /proc/self/io), the peak
+memory allocated and the wall time per slice.
+
+The bytes read from the file include page cache hits. The bytes read from
+the storage are only meaningful with a cold page cache, e.g. after
+``sync; echo 3 > /proc/sys/vm/drop_caches`` as root.
+
+A synthetic EAM-like history file is generated unless one is provided.
+
+Usage:
+    pvpython scripts/benchmark_slice_reads.py
+    pvpython scripts/benchmark_slice_reads.py --ncol 21600 --nlev 72 --ntime 24
+    pvpython scripts/benchmark_slice_reads.py --file eam.h0.nc --variable T
+"""
+
+import argparse
+import importlib.util
+import os
+import tempfile
+import time
+import tracemalloc
+
+import netCDF4
+import numpy as np
+
+PLUGIN = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "src",
+    "e3sm_quickview",
+    "plugins",
+    "eam_reader.py",
+)
+
+
+def load_reader_module():
+    spec = importlib.util.spec_from_file_location("eam_reader", PLUGIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def create_synthetic_file(path, ncol, nlev, ntime, transpose=False):
+    with netCDF4.Dataset(path, "w") as ds:
+        ds.createDimension("time", None)
+        ds.createDimension("lev", nlev)
+        ds.createDimension("ncol", ncol)
+        time_var = ds.createVariable("time", "f8", ("time",))
+        dims = ("time", "ncol", "lev") if transpose else ("time", "lev", "ncol")
+        var = ds.createVariable("T", "f4", dims, fill_value=np.float32(1e20))
+        for t in range(ntime):
+            time_var[t] = t
+            block = np.random.random((nlev, ncol)).astype(np.float32)
+            var[t] = block.T if transpose else block
+
+
+def legacy_slice(variable, varmeta, timeInd, levInd, ncol):
+    # Access pattern used before hyperslab reads were introduced
+    data = variable[:].data[timeInd]
+    if varmeta.transpose:
+        data = data.transpose()
+    data = data.flatten()[levInd * ncol : (levInd + 1) * ncol]
+    return np.where(data == varmeta.fillval, np.nan, data)
+
+
+def read_counters():
+    """Bytes read by the process, through read calls and from the storage."""
+    try:
+        with open("/proc/self/io") as f:
+            counters = dict(line.split(": ") for line in f.read().splitlines())
+    except OSError:
+        return None
+    return int(counters["rchar"]), int(counters["read_bytes"])
+
+
+def format_mib(nbytes, count):
+    if nbytes is None:
+        return f"{'n/a':>9}"
+    return f"{nbytes / count / 2**20:9.2f}"
+
+
+def measure(label, fn, slices, nbytes):
+    tracemalloc.start()
+    before = read_counters()
+    start = time.perf_counter()
+    for t, k in slices:
+        data = fn(t, k)
+    elapsed = time.perf_counter() - start
+    after = read_counters()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    read = storage = None
+    if before is not None and after is not None:
+        read, storage = (b - a for a, b in zip(before, after))
+    count = len(slices)
+    print(
+        f"{label:>10} | {nbytes / 2**20:9.2f}"
+        f" | {format_mib(read, count)}"
+        f" | {format_mib(storage, count)}"
+        f" | {peak / 2**20:9.2f}"
+        f" | {1000 * elapsed / count:9.2f}"
+        f" | {data.dtype}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--file", help="existing EAM history file")
+    parser.add_argument("--variable", default="T", help="3D variable to slice")
+    parser.add_argument("--ncol", type=int, default=21600)
+    parser.add_argument("--nlev", type=int, default=72)
+    parser.add_argument("--ntime", type=int, default=12)
+    parser.add_argument("--transpose", action="store_true")
+    parser.add_argument("--slices", type=int, default=10)
+    args = parser.parse_args()
+
+    eam_reader = load_reader_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = os.path.join(tmp, "synthetic.eam.h0.nc")
+            create_synthetic_file(
+                path, args.ncol, args.nlev, args.ntime, args.transpose
+            )
+
+        with netCDF4.Dataset(path, "r") as ds, netCDF4.Dataset(path, "r") as raw_ds:
+            # The reader disables auto-masking on its datasets
+            raw_ds.set_auto_mask(False)
+            variable = ds[args.variable]
+            varmeta = eam_reader.VarMeta(args.variable, variable)
+            if "_FillValue" in variable.ncattrs():
+                varmeta.fillval = variable.getncattr("_FillValue")
+            shape = dict(zip(variable.dimensions, variable.shape))
+            ntime, ncol = shape["time"], shape["ncol"]
+            nlev = shape.get("lev", shape.get("ilev", 1))
+            itemsize = variable.dtype.itemsize
+
+            rng = np.random.default_rng(0)
+            slices = list(
+                zip(
+                    rng.integers(0, ntime, args.slices).tolist(),
+                    rng.integers(0, nlev, args.slices).tolist(),
+                )
+            )
+
+            print(
+                f"{path} : {args.variable}{variable.dimensions} "
+                f"time={ntime} lev={nlev} ncol={ncol}"
+            )
+            print(
+                f"{'strategy':>10} | {'requested':>9} | {'read':>9} | {'storage':>9}"
+                f" | {'peak':>9} | {'time':>9} | dtype"
+            )
+            print(
+                f"{'':>10} | {'MiB/slice':>9} | {'MiB/slice':>9} | {'MiB/slice':>9}"
+                f" | {'MiB':>9} | {'ms/slice':>9} |"
+            )
+            reader = eam_reader.EAMSliceSource()
+            measure(
+                "legacy",
+                lambda t, k: legacy_slice(variable, varmeta, t, k, ncol),
+                slices,
+                ntime * nlev * ncol * itemsize,
+            )
+            measure(
+                "hyperslab",
+                lambda t, k: reader._load_3d_slice(raw_ds, varmeta, t, k),
+                slices,
+                ncol * itemsize,
+            )
+
+
+if __name__ == "__main__":
+    main()
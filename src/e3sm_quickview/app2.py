@@ -1,6 +1,7 @@
 import asyncio
 import json
 import datetime
+import multiprocessing
 import os
 
 from pathlib import Path
@@ -53,13 +54,33 @@ class EAMApp(TrameApp):
                 # Time controls
                 "time_idx": 0,
                 "timestamps": [],
+                "time_reduction": "None",
+                "time_range": [0, 0],
+                # Vertical slicing (0 for model layers)
+                "pressure_level": 0,
+                # Extra dimensions of the loaded other variables
+                "extra_dimensions": [],
+                "dimension_indices": {},
                 # Fields summaries
                 "fields_avgs": {},
             }
         )
 
         # Data input
-        self.source = EAMVisSource()
+        self.source = EAMVisSource(
+            cache_size=args.cache_size,
+            prefetch_depth=args.prefetch_depth,
+            worker_threads=args.worker_threads,
+            io_processes=args.io_processes,
+            merge_points=args.merge_points,
+            reorder_cells=args.reorder_cells,
+            cache_dir=str(Path(args.workdir) / ".quickview_cache"),
+            index_statistics=args.index_statistics,
+        )
+        self._last_indices = {}
+        self._track_sliders = 0
+        # Seconds between checks for new time steps of a running simulation
+        self._poll_interval = args.poll_interval
 
         # Helpers
         self.view_manager = ViewManager(self.server, self.source)
@@ -67,7 +88,8 @@ class EAMApp(TrameApp):
             self.server,
             prefix="pv_files",
             home=None if args.user_home else args.workdir,  # can use current=
-            group="",
+            # Group history files by date stamp (e.g. case.eam.h0.*.nc)
+            group=r"[0-9]{4}-[0-9]{2}(?:-[0-9]{2})?(?:-[0-9]{5})?\.",
         )
 
         # Process CLI to pre-load data
@@ -103,6 +125,34 @@ class EAMApp(TrameApp):
     def _tauri_show(self, **_):
         os.write(1, "tauri-client-ready\n".encode())
 
+    # -------------------------------------------------------------------------
+    # Run monitoring
+    # -------------------------------------------------------------------------
+
+    @life_cycle.server_ready
+    def _start_monitoring(self, **_):
+        if self._poll_interval > 0:
+            asynchronous.create_task(self._monitor_data_files())
+
+    async def _monitor_data_files(self):
+        """Append the time steps written by a running simulation"""
+        while True:
+            await asyncio.sleep(self._poll_interval)
+            if not self.source.RefreshTimeSteps():
+                continue
+
+            with self.state as s:
+                last = len(s.timestamps) - 1
+                s.timestamps = self.source.timestamps
+                new_last = len(s.timestamps) - 1
+                # Follow the latest output when looking at it
+                if s.time_idx == last:
+                    s.time_idx = new_last
+                if s.time_range[1] == last:
+                    s.time_range = [s.time_range[0], new_last]
+                if s.animation_track == "timestamps":
+                    s.amimation_step_max = new_last
+
     # -------------------------------------------------------------------------
     # UI definition
     # -------------------------------------------------------------------------
@@ -199,7 +249,7 @@ class EAMApp(TrameApp):
 
     @property
     def selected_variables(self):
-        vars_per_type = {n: [] for n in "smi"}
+        vars_per_type = {n: [] for n in "smin"}
         for var in self.state.variables_selected:
             type = var[0]
             name = var[1:]
@@ -244,11 +294,16 @@ class EAMApp(TrameApp):
             k: self.state[k]
             for k in [
                 "time_idx",
+                "time_reduction",
+                "time_range",
                 "midpoint_idx",
                 "interface_idx",
+                "pressure_level",
+                "dimension_indices",
                 "crop_longitude",
                 "crop_latitude",
                 "projection",
+                "center",
             ]
         }
         views_to_export = state_content["views"] = []
@@ -271,6 +326,7 @@ class EAMApp(TrameApp):
                             "break_row": config.break_row,
                             # color range
                             "override_range": config.override_range,
+                            "global_range": config.global_range,
                             "color_range": config.color_range,
                             "color_value_min": config.color_value_min,
                             "color_value_max": config.color_value_max,
@@ -335,8 +391,13 @@ class EAMApp(TrameApp):
         self.state.midpoints = []
         self.state.interface_idx = 0
         self.state.interfaces = []
+        self.state.pressure_level = 0
+        self.state.extra_dimensions = []
+        self.state.dimension_indices = {}
         self.state.time_idx = 0
         self.state.timestamps = []
+        self.state.time_reduction = "None"
+        self.state.time_range = [0, 0]
 
         await asyncio.sleep(0.1)
         self.source.Update(
@@ -371,6 +432,10 @@ class EAMApp(TrameApp):
                         {"name": name, "type": "midpoint", "id": f"m{name}"}
                         for name in self.source.midpoint_vars
                     ),
+                    *(
+                        {"name": name, "type": "other", "id": f"n{name}"}
+                        for name in self.source.other_vars
+                    ),
                 ]
 
                 # Update Layer/Time values and ui layout
@@ -384,6 +449,8 @@ class EAMApp(TrameApp):
                         n_cols += 1
                         available_tracks.append(constants.TRACK_ENTRIES[name])
 
+                self.state.time_range = [0, max(0, len(self.source.timestamps) - 1)]
+                self._track_sliders = n_cols
                 self.state.toolbar_slider_cols = 12 / n_cols if n_cols else 12
                 self.state.animation_tracks = available_tracks
                 self.state.animation_track = (
@@ -409,8 +476,16 @@ class EAMApp(TrameApp):
             vars_to_show["s"],  # surfaces
             vars_to_show["m"],  # midpoints
             vars_to_show["i"],  # interfaces
+            vars_to_show["n"],  # others
         )
 
+        # One slider per extra dimension of the other variables
+        extra_dimensions = self.source.GetExtraDimensions(vars_to_show["n"])
+        n_cols = self._track_sliders + len(extra_dimensions)
+        with self.state:
+            self.state.extra_dimensions = extra_dimensions
+            self.state.toolbar_slider_cols = 12 / n_cols if n_cols else 12
+
         # Trigger source update + compute avg
         with self.state:
             self.state.variables_loaded = True
@@ -446,6 +521,12 @@ class EAMApp(TrameApp):
                 await asyncio.sleep(0.1)
                 self.view_manager.reset_camera()
 
+    @change("center")
+    def _on_center(self, center, **_):
+        self.source.UpdateCenter(center[0])
+        self.source.UpdatePipeline()
+        self.view_manager.reset_camera()
+
     @change("active_tools")
     def _on_toolbar_change(self, active_tools, **_):
         top_padding = 0
@@ -457,32 +538,47 @@ class EAMApp(TrameApp):
     @change(
         "variables_loaded",
         "time_idx",
+        "time_reduction",
+        "time_range",
         "midpoint_idx",
         "interface_idx",
+        "pressure_level",
+        "dimension_indices",
         "crop_longitude",
         "crop_latitude",
         "projection",
+        "center",
     )
     def _on_time_change(
         self,
         variables_loaded,
         time_idx,
         timestamps,
+        time_reduction,
+        time_range,
         midpoint_idx,
         interface_idx,
+        pressure_level,
+        dimension_indices,
         crop_longitude,
         crop_latitude,
         projection,
+        center,
         **_,
     ):
         if not variables_loaded:
             return
 
         time_value = timestamps[time_idx] if len(timestamps) else 0.0
+        self._update_prefetch(time_idx, midpoint_idx, interface_idx)
         self.source.UpdateLev(midpoint_idx, interface_idx)
+        self.source.UpdatePressureLevel(pressure_level)
+        self.source.UpdateDimensionIndices(dimension_indices)
         self.source.ApplyClipping(crop_longitude, crop_latitude)
         self.source.UpdateProjection(projection[0])
+        self.source.UpdateCenter(center[0])
         self.source.UpdateTimeStep(time_idx)
+        self.source.UpdateTimeReduction(time_reduction, time_range)
         self.source.UpdatePipeline(time_value)
 
         self.view_manager.update_color_range()
@@ -492,9 +588,28 @@ class EAMApp(TrameApp):
         # Get area variable to calculate weighted average
         data = self.source.views["atmosphere_data"]
         self.state.fields_avgs = compute.extract_avgs(
-            data, self.selected_variable_names
+            data,
+            self.selected_variable_names,
+            statistics=self.source.GetSliceStatistics,
         )
 
+    def _update_prefetch(self, time_idx, midpoint_idx, interface_idx):
+        """Make the reader prefetch along the track the user is moving on"""
+        indices = {
+            "timestamps": time_idx,
+            "midpoints": midpoint_idx,
+            "interfaces": interface_idx,
+        }
+        if self.state.animation_play and self.state.animation_track:
+            self.source.UpdatePrefetch(self.state.animation_track, 1)
+        else:
+            for track, index in indices.items():
+                delta = index - self._last_indices.get(track, index)
+                if delta:
+                    self.source.UpdatePrefetch(track, delta)
+                    break
+        self._last_indices = indices
+
     def toggle_toolbar(self, toolbar_name=None):
         if toolbar_name is None:
             self.state.compact_drawer = True
@@ -516,6 +631,9 @@ class EAMApp(TrameApp):
 # Standalone execution
 # -------------------------------------------------------------------------
 def main():
+    # Spawned I/O and statistics workers of the frozen (tauri) build must not
+    # start the app again
+    multiprocessing.freeze_support()
     app = EAMApp()
     app.server.start()
 
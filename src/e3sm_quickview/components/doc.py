@@ -66,7 +66,7 @@ class ToolMapProjection(Tool):
         super().__init__(
             icon="mdi-earth",
             title="Map Projection",
-            description="Select projection to use for the visualizations. (Cylindrical Equidistant, Robinson, Mollweide)",
+            description="Select projection to use for the visualizations (Cylindrical Equidistant, Robinson, Mollweide), and center the maps on the Atlantic or the Pacific.",
         )
         with self, v3.Template(v_slot_append=True):
             v3.VHotkey(keys="e", variant="contained", inline=True)
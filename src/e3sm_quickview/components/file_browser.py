@@ -128,7 +128,7 @@ class ParaViewFileBrowser(TrameComponent):
 
                 g_map[g_name]["size"] += stats.st_size
                 g_map[g_name]["files"].append(file_name)
-                # Many need to sort files???
+                g_map[g_name]["files"].sort()
             else:
                 # File
                 files.append(
@@ -140,6 +140,19 @@ class ParaViewFileBrowser(TrameComponent):
                     )
                 )
 
+        # A group of a single file is just a file
+        for g_entry in [g for g in groups if len(g["files"]) == 1]:
+            groups.remove(g_entry)
+            f = self._current_path / g_entry["files"][0]
+            files.append(
+                dict(
+                    name=f.name,
+                    modified=g_entry["modified"],
+                    size=g_entry["size"],
+                    **FILE,
+                )
+            )
+
         # Directories
         dir_listing = []
         if len(self._proxy_directories) > 1:
@@ -173,9 +186,11 @@ class ParaViewFileBrowser(TrameComponent):
             self.update_listing()
             return entry_type, str(self._current_path)
         if entry_type == "group":
-            files = entry.get("files", [])
-            self.update_listing()
-            return entry, [str(self._current_path / f) for f in files]
+            # The reader loads a group as one time series from its glob pattern
+            full_path = str(self._current_path / entry.get("name"))
+            self.set("data_simulation", full_path)
+            self.update_listing(full_path)
+            return entry_type, full_path
         if entry_type == "file":
             file = self._current_path / entry.get("name")
             file_name = file.name.lower()
@@ -392,7 +407,7 @@ class ParaViewFileBrowser(TrameComponent):
                     text="Simulation",
                     prepend_icon="mdi-database-plus",
                     disabled=(
-                        f"{self.name('listing')}[{self.name('active')}]?.type !== 'file'",
+                        f"!['file', 'group'].includes({self.name('listing')}[{self.name('active')}]?.type)",
                     ),
                     click=self.set_data_simulation,
                 )
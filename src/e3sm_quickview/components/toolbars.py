@@ -244,18 +244,30 @@ class DataSelection(v3.VToolbar):
                     cols=("toolbar_slider_cols", 4),
                     v_show="midpoints.length > 1",
                 ):
-                    with v3.VRow(classes="mx-2 my-0"):
+                    with v3.VRow(classes="mx-2 my-0 align-center"):
                         v3.VLabel(
                             "Layer Midpoints",
                             classes="text-subtitle-2",
                         )
+                        v3.VSelect(
+                            v_model=("pressure_level", 0),
+                            items=("pressure_levels", constants.PRESSURE_LEVELS),
+                            flat=True,
+                            variant="plain",
+                            hide_details=True,
+                            density="compact",
+                            classes="mx-2 my-n2",
+                            style="max-width: 10rem;",
+                        )
                         v3.VSpacer()
                         v3.VLabel(
                             "{{ parseFloat(midpoints[midpoint_idx] || 0).toFixed(2) }} hPa (k={{ midpoint_idx }})",
+                            v_show="!pressure_level",
                             classes="text-body-2",
                         )
                     v3.VSlider(
                         v_model=("midpoint_idx", 0),
+                        disabled=("pressure_level > 0",),
                         min=0,
                         max=("Math.max(0, midpoints.length - 1)",),
                         step=1,
@@ -276,10 +288,12 @@ class DataSelection(v3.VToolbar):
                         v3.VSpacer()
                         v3.VLabel(
                             "{{ parseFloat(interfaces[interface_idx] || 0).toFixed(2) }} hPa (k={{interface_idx}})",
+                            v_show="!pressure_level",
                             classes="text-body-2",
                         )
                     v3.VSlider(
                         v_model=("interface_idx", 0),
+                        disabled=("pressure_level > 0",),
                         min=0,
                         max=("Math.max(0, interfaces.length - 1)",),
                         step=1,
@@ -287,20 +301,64 @@ class DataSelection(v3.VToolbar):
                         hide_details=True,
                     )
 
+                # extra dimensions of the other variables
+                with v3.VCol(
+                    v_for="dim in extra_dimensions",
+                    key="dim.name",
+                    cols=("toolbar_slider_cols", 4),
+                    v_show="dim.size > 1",
+                ):
+                    with v3.VRow(classes="mx-2 my-0"):
+                        v3.VLabel(
+                            "{{ dim.name }}",
+                            classes="text-subtitle-2",
+                        )
+                        v3.VSpacer()
+                        v3.VLabel(
+                            "{{ dimension_indices[dim.name] || 0 }} / {{ dim.size - 1 }}",
+                            classes="text-body-2",
+                        )
+                    v3.VSlider(
+                        model_value=("dimension_indices[dim.name] || 0",),
+                        update_modelValue="dimension_indices = { ...dimension_indices, [dim.name]: $event }",
+                        min=0,
+                        max=("dim.size - 1",),
+                        step=1,
+                        density="compact",
+                        hide_details=True,
+                    )
+
                 # time
                 with v3.VCol(
                     cols=("toolbar_slider_cols", 4),
                     v_show="timestamps.length > 1",
                 ):
                     self.state.setdefault("time_value", 80.50)
-                    with v3.VRow(classes="mx-2 my-0"):
+                    with v3.VRow(classes="mx-2 my-0 align-center"):
                         v3.VLabel("Time", classes="text-subtitle-2")
+                        v3.VSelect(
+                            v_model=("time_reduction", "None"),
+                            items=("time_reductions", constants.TIME_REDUCTIONS),
+                            flat=True,
+                            variant="plain",
+                            hide_details=True,
+                            density="compact",
+                            classes="mx-2 my-n2",
+                            style="max-width: 12rem;",
+                        )
                         v3.VSpacer()
                         v3.VLabel(
                             "{{ parseFloat(timestamps[time_idx]).toFixed(2) }} (t={{time_idx}})",
+                            v_if="time_reduction === 'None'",
+                            classes="text-body-2",
+                        )
+                        v3.VLabel(
+                            "{{ parseFloat(timestamps[time_range[0]]).toFixed(2) }} - {{ parseFloat(timestamps[time_range[1]]).toFixed(2) }} (t={{time_range[0]}}-{{time_range[1]}})",
+                            v_else=True,
                             classes="text-body-2",
                         )
                     v3.VSlider(
+                        v_if="time_reduction === 'None'",
                         v_model=("time_idx", 0),
                         min=0,
                         max=("Math.max(0, timestamps.length - 1)",),
@@ -308,6 +366,15 @@ class DataSelection(v3.VToolbar):
                         density="compact",
                         hide_details=True,
                     )
+                    v3.VRangeSlider(
+                        v_else=True,
+                        v_model=("time_range", [0, 0]),
+                        min=0,
+                        max=("Math.max(0, timestamps.length - 1)",),
+                        step=1,
+                        density="compact",
+                        hide_details=True,
+                    )
 
 
 class Animation(v3.VToolbar):
@@ -208,30 +208,56 @@ class MapProjection(v3.VTooltip):
                         location="end",
                         offset=10,
                     ):
-                        with v3.VList(
-                            mandatory=True,
-                            v_model_selected=(
-                                "projection",
-                                ["Cyl. Equidistant"],
-                            ),
-                            density="compact",
-                            # items=("projections", self.options),
-                        ):
-                            for entry in self.options:
-                                with (
+                        with v3.VSheet():
+                            with v3.VList(
+                                mandatory=True,
+                                v_model_selected=(
+                                    "projection",
+                                    ["Cyl. Equidistant"],
+                                ),
+                                density="compact",
+                                # items=("projections", self.options),
+                            ):
+                                for entry in self.options:
+                                    with (
+                                        v3.VListItem(
+                                            title=entry.get("title"),
+                                            value=entry.get("value"),
+                                        ),
+                                        v3.Template(v_slot_append=True),
+                                    ):
+                                        v3.VHotkey(
+                                            keys=entry.get("key"),
+                                            variant="contained",
+                                            inline=True,
+                                            classes="ml-4 mn-2",
+                                        )
+                            v3.VDivider()
+                            with v3.VList(
+                                mandatory=True,
+                                v_model_selected=("center", [0]),
+                                density="compact",
+                            ):
+                                v3.VListSubheader("Central meridian")
+                                for entry in self.centers:
                                     v3.VListItem(
                                         title=entry.get("title"),
                                         value=entry.get("value"),
-                                    ),
-                                    v3.Template(v_slot_append=True),
-                                ):
-                                    v3.VHotkey(
-                                        keys=entry.get("key"),
-                                        variant="contained",
-                                        inline=True,
-                                        classes="ml-4 mn-2",
                                     )
 
+    @property
+    def centers(self):
+        return [
+            {
+                "title": "Atlantic (0°)",
+                "value": 0,
+            },
+            {
+                "title": "Pacific (180°)",
+                "value": 180,
+            },
+        ]
+
     @property
     def options(self):
         return [
@@ -172,6 +172,19 @@ def create_bottom_bar(config, update_color_preset):
                             text="Use data range",
                             variant="text",
                         )
+                        v3.VIconBtn(
+                            v_show="!config.override_range",
+                            raw_attrs=[
+                                '''v-tooltip:bottom="config.global_range ? 'Range over all time steps' : 'Range of current time step'"'''
+                            ],
+                            icon=(
+                                "config.global_range ? 'mdi-timeline-clock-outline' : 'mdi-clock-outline'",
+                            ),
+                            click="config.global_range = !config.global_range",
+                            size="small",
+                            text="Time range",
+                            variant="text",
+                        )
 
                         with v3.Template(v_slot_append=True):
                             v3.VLabel(
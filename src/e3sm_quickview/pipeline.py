@@ -15,6 +15,33 @@ from paraview import servermanager as sm
 from paraview.vtk.numpy_interface import dataset_adapter as dsa
 from vtkmodules.vtkCommonCore import vtkLogger
 
+from e3sm_quickview.utils.statistics import StatisticsIndex
+
+
+# Map animation tracks to the reader "Prefetch Track" entries
+PREFETCH_TRACKS = {
+    "timestamps": "Time",
+    "midpoints": "Middle Layer",
+    "interfaces": "Interface Layer",
+}
+
+# Stages of the pipeline, updated only when one of the sources they depend
+# on was modified, or, for time dependent stages, when the time changed:
+# (view, sources, time dependent)
+PIPELINE_STAGES = (
+    (
+        "atmosphere_data",
+        ("AtmosReader", "AtmosExtract", "AtmosCenter", "AtmosProj"),
+        True,
+    ),
+    ("continents", ("ContExtract", "ContCenter", "ContProj"), False),
+    # The grid lines span the bounds of the extracted atmosphere data
+    ("grid_lines", ("AtmosExtract", "GridGen", "GridCenter", "GridProj"), False),
+)
+
+# Filters moving the central meridian of the maps
+CENTER_SOURCES = ("AtmosCenter", "ContCenter", "GridCenter")
+
 
 # Define a VTK error observer
 class ErrorObserver:
@@ -30,7 +57,17 @@ class ErrorObserver:
 
 
 class EAMVisSource:
-    def __init__(self):
+    def __init__(
+        self,
+        cache_size=1024,
+        prefetch_depth=4,
+        worker_threads=4,
+        io_processes=0,
+        merge_points=False,
+        reorder_cells=False,
+        cache_dir=None,
+        index_statistics=False,
+    ):
         # flag to check if the pipeline is valid
         # this is set to true when the pipeline is updated
         # and the data is available
@@ -41,11 +78,16 @@ class EAMVisSource:
 
         self.midpoints = []
         self.interfaces = []
+        # Pressure (hPa) 3D variables are sliced at, 0 for model layers
+        self.pressure_level = 0
 
         # List of all available variables
         self.surface_vars = []
         self.midpoint_vars = []
         self.interface_vars = []
+        self.other_vars = []
+        # Extra dimensions of the other variables { name : [(dim, size)] }
+        self.extra_dims = {}
         # List of selected variables
         self.surface_vars_sel = []
         self.interface_vars_sel = []
@@ -55,13 +97,42 @@ class EAMVisSource:
         self.globe = None
         self.projection = "Cyl. Equidistant"
         self.timestamps = []
+        self.time_index = 0
+        self.time_reduction = "None"
         self.center = 0.0
 
         self.extents = [-180.0, 180.0, -90.0, 90.0]
         self.moveextents = [-180.0, 180.0, -90.0, 90.0]
+        # Whether the crop box leaves out part of the globe
+        self.cropped = False
 
         self.views = {}
-        self.vars = {"surface": [], "midpoint": [], "interface": []}
+        self.vars = {"surface": [], "midpoint": [], "interface": [], "other": []}
+        # Time and source MTimes of the last update of each stage
+        self._stage_keys = {}
+        self._time = 0.0
+        # Stages run by the last UpdatePipeline call
+        self.updated_stages = []
+
+        # Memory budget (in MB) of the reader slice cache
+        self.cache_size = cache_size
+        # Number of upcoming slices the reader loads in the background
+        self.prefetch_depth = prefetch_depth
+        # Number of threads the reader uses to load the selected variables
+        self.worker_threads = worker_threads
+        # Number of processes the reader uses to read slices (0 to disable)
+        self.io_processes = io_processes
+        # Whether the reader shares the vertices of neighbouring cells
+        self.merge_points = merge_points
+        # Whether the reader sorts the cells along a Hilbert curve
+        self.reorder_cells = reorder_cells
+        # Directory for data persisted across sessions (disabled when None)
+        self.cache_dir = cache_dir
+        # Per-slice statistics of the data file(s), built in the background
+        # by reading every slice, so only on request
+        self.statistics = None
+        if cache_dir is not None and index_statistics:
+            self.statistics = StatisticsIndex(os.path.join(cache_dir, "statistics"))
 
         self.observer = ErrorObserver()
         try:
@@ -105,10 +176,44 @@ class EAMVisSource:
             self.data.MiddleLayer = lev_idx
             self.data.InterfaceLayer = ilev_idx
 
+    def UpdatePressureLevel(self, pressure):
+        if not self.valid:
+            return
+
+        pressure = float(pressure or 0)
+        if self.pressure_level != pressure:
+            self.pressure_level = pressure
+            self.data.PressureLevel = pressure
+
+    def UpdateDimensionIndices(self, indices):
+        if not self.valid:
+            return
+
+        # The full list is pushed, an empty one resetting all the dimensions
+        values = []
+        for name, index in sorted((indices or {}).items()):
+            values.extend((name, str(int(index))))
+        if list(self.data.DimensionIndices) != values:
+            self.data.DimensionIndices = values
+
+    def GetExtraDimensions(self, names):
+        """Extra dimensions, with their size, of a list of other variables."""
+        dims = {}
+        for name in names:
+            dims.update(self.extra_dims.get(name, []))
+        return [{"name": name, "size": size} for name, size in dims.items()]
+
     def ApplyClipping(self, cliplong, cliplat):
         if not self.valid:
             return
 
+        self.cropped = list(cliplong) != [-180, 180] or list(cliplat) != [-90, 90]
+
+        # The reader only loads the cells overlapping the crop box
+        self.data.LongitudeRange = cliplong
+        self.data.LatitudeRange = cliplat
+
+        # which are then clipped exactly to the box
         atmos_extract = FindSource("AtmosExtract")
         atmos_extract.LongitudeRange = cliplong
         atmos_extract.LatitudeRange = cliplat
@@ -118,17 +223,15 @@ class EAMVisSource:
         cont_extract.LatitudeRange = cliplat
 
     def UpdateCenter(self, center):
-        """
-        if self.center != int(center):
-            self.center = int(center)
-
-            meridian = FindSource("CenterMeridian")
-            meridian.CenterMeridian = self.center
+        """Center the maps on the meridian of the given longitude."""
+        self.center = int(center)
+        if not self.valid:
+            return
 
-            gmeridian = FindSource("GCMeridian")
-            gmeridian.CenterMeridian = self.center
-        """
-        pass
+        for name in CENTER_SOURCES:
+            meridian = FindSource(name)
+            if meridian.CenterMeridian != self.center:
+                meridian.CenterMeridian = self.center
 
     def UpdateProjection(self, proj):
         if not self.valid:
@@ -143,37 +246,82 @@ class EAMVisSource:
             cont_proj.Projection = proj
             grid_proj.Projection = proj
 
+    def UpdatePrefetch(self, track, direction=1):
+        if self.data is None or track not in PREFETCH_TRACKS:
+            return
+
+        self.data.PrefetchTrack = PREFETCH_TRACKS[track]
+        self.data.PrefetchDirection = -1 if direction < 0 else 1
+
     def UpdateTimeStep(self, t_index):
         if not self.valid:
             return
 
-    def UpdatePipeline(self, time=0.0):
+        self.time_index = int(t_index)
+
+    def UpdateTimeReduction(self, reduction, time_range):
         if not self.valid:
             return
 
+        # The reader streams through the range, one time step at a time
+        self.time_reduction = reduction
+        self.data.TimeReduction = reduction
+        self.data.TimeReductionRange = [int(t) for t in time_range]
+
+    def _GetStageKey(self, sources, timed):
+        key = tuple(
+            FindSource(name).GetClientSideObject().GetMTime() for name in sources
+        )
+        return key + (self._time,) if timed else key
+
+    def _UpdateAtmosphere(self):
         atmos_proj = FindSource("AtmosProj")
-        if atmos_proj:
-            atmos_proj.UpdatePipeline(time)
+        atmos_proj.UpdatePipeline(self._time)
         self.moveextents = atmos_proj.GetDataInformation().GetBounds()
 
-        cont_proj = FindSource("ContProj")
-        if cont_proj:
-            cont_proj.UpdatePipeline(time)
+    def _UpdateContinents(self):
+        FindSource("ContProj").UpdatePipeline(self._time)
 
+    def _UpdateGridLines(self):
         atmos_extract = FindSource("AtmosExtract")
         bounds = atmos_extract.GetDataInformation().GetBounds()
 
         grid_gen = FindSource("GridGen")
-        if grid_gen:
-            grid_gen.LongitudeRange = [bounds[0], bounds[1]]
-            grid_gen.LatitudeRange = [bounds[2], bounds[3]]
-        grid_proj = FindSource("GridProj")
-        if grid_proj:
-            grid_proj.UpdatePipeline(time)
-
-        self.views["atmosphere_data"] = OutputPort(atmos_proj, 0)
-        self.views["continents"] = OutputPort(cont_proj, 0)
-        self.views["grid_lines"] = OutputPort(grid_proj, 0)
+        longitude_range = [bounds[0], bounds[1]]
+        latitude_range = [bounds[2], bounds[3]]
+        if list(grid_gen.LongitudeRange) != longitude_range:
+            grid_gen.LongitudeRange = longitude_range
+        if list(grid_gen.LatitudeRange) != latitude_range:
+            grid_gen.LatitudeRange = latitude_range
+        FindSource("GridProj").UpdatePipeline(self._time)
+
+    def UpdatePipeline(self, time=None):
+        """
+        Update the stages of the pipeline whose inputs changed since their
+        last update, at the given time (by default, the time of the last
+        update). Returns the names of the stages that ran.
+        """
+        if not self.valid:
+            return []
+
+        if time is not None:
+            self._time = time
+
+        update = {
+            "atmosphere_data": self._UpdateAtmosphere,
+            "continents": self._UpdateContinents,
+            "grid_lines": self._UpdateGridLines,
+        }
+        self.updated_stages = []
+        for name, sources, timed in PIPELINE_STAGES:
+            if self._stage_keys.get(name) == self._GetStageKey(sources, timed):
+                continue
+            update[name]()
+            # Keyed after the update, which may modify the stage sources
+            self._stage_keys[name] = self._GetStageKey(sources, timed)
+            self.updated_stages.append(name)
+
+        return self.updated_stages
 
     def Update(self, data_file, conn_file, midpoint=0, interface=0, force_reload=False):
         # Check if we need to reload
@@ -186,6 +334,9 @@ class EAMVisSource:
 
         self.data_file = data_file
         self.conn_file = conn_file
+        # The stages are rebuilt below
+        self._stage_keys.clear()
+        self._time = 0.0
 
         if self.data is None:
             data = EAMSliceDataReader(
@@ -195,6 +346,16 @@ class EAMVisSource:
             )
             data.MiddleLayer = midpoint
             data.InterfaceLayer = interface
+            data.CacheSize = self.cache_size
+            data.PrefetchDepth = self.prefetch_depth
+            data.WorkerThreads = self.worker_threads
+            data.IOProcesses = self.io_processes
+            # The 2D pipeline only clips and projects, shared points are safe
+            data.MergePoints = int(self.merge_points)
+            data.ReorderCells = int(self.reorder_cells)
+            if self.cache_dir is not None:
+                data.GeometryCacheDirectory = os.path.join(self.cache_dir, "geometry")
+                data.MetadataCacheDirectory = os.path.join(self.cache_dir, "metadata")
             self.data = data
             vtk_obj = data.GetClientSideObject()
             vtk_obj.AddObserver("ErrorEvent", self.observer)
@@ -228,6 +389,14 @@ class EAMVisSource:
             self.interface_vars = list(
                 np.asarray(self.data.GetProperty("InterfaceVariablesInfo"))[::2]
             )
+            self.other_vars = list(
+                np.asarray(self.data.GetProperty("OtherVariablesInfo"))[::2]
+            )
+            # (variable, dimension, size) triplets
+            info = list(self.data.GetProperty("ExtraDimensionsInfo"))
+            self.extra_dims = {}
+            for name, dim, size in zip(info[0::3], info[1::3], info[2::3]):
+                self.extra_dims.setdefault(name, []).append((dim, int(size)))
             # Ensure TimestepValues is always a list
             timestep_values = self.data.TimestepValues
             if isinstance(timestep_values, (list, tuple)):
@@ -252,16 +421,22 @@ class EAMVisSource:
             atmos_extract.UpdatePipeline()
             self.extents = atmos_extract.GetDataInformation().GetBounds()
 
-            # Step 2: Apply map projection to atmospheric data
+            # Step 2: Move the central meridian of the atmospheric data
+            atmos_center = EAMCenterMeridian(
+                registrationName="AtmosCenter", Input=OutputPort(atmos_extract, 0)
+            )
+            atmos_center.CenterMeridian = int(self.center)
+
+            # Step 3: Apply map projection to atmospheric data
             atmos_proj = EAMProject(
-                registrationName="AtmosProj", Input=OutputPort(atmos_extract, 0)
+                registrationName="AtmosProj", Input=OutputPort(atmos_center, 0)
             )
             atmos_proj.Projection = self.projection
             atmos_proj.Translate = 0
             atmos_proj.UpdatePipeline()
             self.moveextents = atmos_proj.GetDataInformation().GetBounds()
 
-            # Step 3: Load and process continent outlines
+            # Step 4: Load and process continent outlines
             if self.globe is None:
                 globe_file = os.path.join(
                     os.path.dirname(__file__), "data", "globe.vtk"
@@ -277,40 +452,51 @@ class EAMVisSource:
                 cont_contour.PointMergeMethod = "Uniform Binning"
                 self.globe = cont_contour
 
-            # Step 4: Extract and transform continent data
+            # Step 5: Extract and transform continent data
             cont_extract = EAMTransformAndExtract(
                 registrationName="ContExtract", Input=self.globe
             )
             cont_extract.LongitudeRange = [-180.0, 180.0]
             cont_extract.LatitudeRange = [-90.0, 90.0]
+            cont_center = EAMCenterMeridian(
+                registrationName="ContCenter", Input=OutputPort(cont_extract, 0)
+            )
+            cont_center.CenterMeridian = int(self.center)
 
-            # Step 5: Apply map projection to continents
+            # Step 6: Apply map projection to continents
             cont_proj = EAMProject(
-                registrationName="ContProj", Input=OutputPort(cont_extract, 0)
+                registrationName="ContProj", Input=OutputPort(cont_center, 0)
             )
             cont_proj.Projection = self.projection
             cont_proj.Translate = 0
             cont_proj.UpdatePipeline()
 
-            # Step 6: Generate lat/lon grid lines
+            # Step 7: Generate lat/lon grid lines
             grid_gen = EAMGridLines(registrationName="GridGen")
             grid_gen.UpdatePipeline()
+            grid_center = EAMCenterMeridian(
+                registrationName="GridCenter", Input=OutputPort(grid_gen, 0)
+            )
+            grid_center.CenterMeridian = int(self.center)
 
-            # Step 7: Apply map projection to grid lines
+            # Step 8: Apply map projection to grid lines
             grid_proj = EAMProject(
-                registrationName="GridProj", Input=OutputPort(grid_gen, 0)
+                registrationName="GridProj", Input=OutputPort(grid_center, 0)
             )
             grid_proj.Projection = self.projection
             grid_proj.Translate = 0
             grid_proj.UpdatePipeline()
 
-            # Step 8: Cache all projected views for rendering
+            # Step 9: Cache all projected views for rendering
             self.views["atmosphere_data"] = OutputPort(atmos_proj, 0)
             self.views["continents"] = OutputPort(cont_proj, 0)
             self.views["grid_lines"] = OutputPort(grid_proj, 0)
 
             self.valid = True
             self.observer.clear()
+
+            if self.statistics is not None:
+                self.statistics.open(data_file)
         except Exception as e:
             # print("Error in UpdatePipeline :", e)
             # traceback.print_stack()
@@ -319,15 +505,67 @@ class EAMVisSource:
 
         return self.valid
 
-    def LoadVariables(self, surf, mid, intf):
+    def RefreshTimeSteps(self):
+        """Pick up the time steps a running simulation appended to the data."""
+        if not self.valid:
+            return False
+        if not self.data.GetClientSideObject().RefreshTimeSteps():
+            return False
+
+        self.data.UpdatePipelineInformation()
+        self.timestamps = list(np.atleast_1d(self.data.TimestepValues))
+        return True
+
+    def GetCacheStatistics(self):
+        if self.data is None:
+            return {}
+        return self.data.GetClientSideObject().GetCacheStatistics()
+
+    def _IsIndexed(self):
+        return (
+            self.valid
+            and self.statistics is not None
+            and not self.cropped
+            and self.time_reduction == "None"
+            and not self.pressure_level
+        )
+
+    def _GetLevelIndex(self, name):
+        if name in self.midpoint_vars:
+            return self.data.MiddleLayer
+        if name in self.interface_vars:
+            return self.data.InterfaceLayer
+        return 0
+
+    def GetSliceStatistics(self, name):
+        """
+        Statistics of the displayed slice of a variable, from the index.
+
+        Returns None until the index is built, or when the crop box leaves
+        out part of the globe or the time steps are reduced, the index only
+        describes whole slices.
+        """
+        if not self._IsIndexed():
+            return None
+        return self.statistics.lookup(name, self.time_index, self._GetLevelIndex(name))
+
+    def GetGlobalRange(self, name):
+        """Range of the displayed layer of a variable across all time steps."""
+        if not self._IsIndexed():
+            return None
+        return self.statistics.global_range(name, self._GetLevelIndex(name))
+
+    def LoadVariables(self, surf, mid, intf, other=()):
         if not self.valid:
             return
         self.data.SurfaceVariables = surf
         self.data.MidpointVariables = mid
         self.data.InterfaceVariables = intf
+        self.data.OtherVariables = list(other)
         self.vars["surface"] = surf
         self.vars["midpoint"] = mid
         self.vars["interface"] = intf
+        self.vars["other"] = list(other)
 
 
 if __name__ == "__main__":
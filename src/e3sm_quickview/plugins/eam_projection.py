@@ -5,14 +5,12 @@ from vtkmodules.vtkCommonCore import vtkPoints
 from vtkmodules.vtkCommonDataModel import (
     vtkPolyData,
     vtkCellArray,
+    vtkDataObject,
     vtkPlane,
+    vtkUnstructuredGrid,
 )
-from vtkmodules.vtkCommonTransforms import vtkTransform
-from vtkmodules.vtkFiltersCore import vtkAppendFilter
-from vtkmodules.vtkFiltersGeneral import (
-    vtkTransformFilter,
-    vtkTableBasedClipDataSet,
-)
+from vtkmodules.vtkFiltersCore import vtkAppendFilter, vtkThreshold
+from vtkmodules.vtkFiltersGeneral import vtkTableBasedClipDataSet
 
 try:
     from paraview.modules.vtkPVVTKExtensionsFiltersGeneral import vtkPVClipDataSet
@@ -24,6 +22,7 @@ from vtkmodules.util.vtkAlgorithm import VTKPythonAlgorithmBase
 from paraview import print_error
 
 import math
+from collections import OrderedDict
 
 try:
     import numpy as np
@@ -53,6 +52,198 @@ def ProcessPoint(point, radius):
     return [x, y, z]
 
 
+# Cell data marking, through the clips, the input cell of each output cell
+CELL_IDS = "vtkOriginalCellIds"
+CELL_CLASS = "CellClass"
+
+
+def _cell_arrays(dataset):
+    """Cell arrays of a dataset, in cell id order."""
+    if dataset.IsA("vtkPolyData"):
+        return [
+            dataset.GetVerts(),
+            dataset.GetLines(),
+            dataset.GetPolys(),
+            dataset.GetStrips(),
+        ]
+    return [dataset.GetCells()]
+
+
+def _geometry_key(dataset):
+    """Identify the geometry of a dataset."""
+    cells = _cell_arrays(dataset)
+    points = dataset.GetPoints()
+    pointData = dataset.GetPointData()
+    return (
+        points.GetMTime() if points is not None else 0,
+        tuple(c.GetMTime() if c is not None else 0 for c in cells),
+        dataset.GetNumberOfCells(),
+        # Point data is interpolated by the clips
+        tuple(
+            pointData.GetAbstractArray(i).GetMTime()
+            for i in range(pointData.GetNumberOfArrays())
+        ),
+    )
+
+
+def _cell_bounds(dataset):
+    """Per-cell (x, y, z) minimum and maximum of a dataset."""
+    ncells = dataset.GetNumberOfCells()
+    mins = np.full((ncells, 3), np.nan)
+    maxs = np.full((ncells, 3), np.nan)
+    if dataset.GetPoints() is None:
+        return mins, maxs
+    points = numpy_support.vtk_to_numpy(dataset.GetPoints().GetData())
+    start = 0
+    for cells in _cell_arrays(dataset):
+        if cells is None or cells.GetNumberOfCells() == 0:
+            continue
+        count = cells.GetNumberOfCells()
+        offsets = numpy_support.vtk_to_numpy(cells.GetOffsetsArray())
+        corners = points[numpy_support.vtk_to_numpy(cells.GetConnectivityArray())]
+        sizes = np.diff(offsets)
+        # reduceat needs valid starts, empty cells keep NaN bounds and
+        # are left out of the output
+        used = np.flatnonzero(sizes > 0)
+        if len(used):
+            first = offsets[:-1][used]
+            mins[start + used] = np.minimum.reduceat(corners, first)
+            maxs[start + used] = np.maximum.reduceat(corners, first)
+        start += count
+    return mins, maxs
+
+
+def _classified_copy(dataset, classes):
+    """
+    Copy of a dataset whose cell data only holds the cell ids, and the
+    class of each cell.
+    """
+    work = dataset.NewInstance()
+    work.ShallowCopy(dataset)
+    work.GetCellData().Initialize()
+    ids = numpy_support.numpy_to_vtk(
+        np.arange(dataset.GetNumberOfCells(), dtype=np.int64),
+        deep=True,
+        array_type=vtkConstants.VTK_ID_TYPE,
+    )
+    ids.SetName(CELL_IDS)
+    work.GetCellData().AddArray(ids)
+    classArray = numpy_support.numpy_to_vtk(classes, deep=True)
+    classArray.SetName(CELL_CLASS)
+    work.GetCellData().AddArray(classArray)
+    return work
+
+
+def _select_class(work, value):
+    """Cells of a classified copy with the given class."""
+    threshold = vtkThreshold()
+    threshold.SetInputData(work)
+    threshold.SetInputArrayToProcess(
+        0, 0, 0, vtkDataObject.FIELD_ASSOCIATION_CELLS, CELL_CLASS
+    )
+    threshold.SetLowerThreshold(value)
+    threshold.SetUpperThreshold(value)
+    threshold.Update()
+    return threshold.GetOutput()
+
+
+def _clip_plane(dataset, x, normal):
+    """Clip a dataset by the plane of longitude ``x``."""
+    plane = vtkPlane()
+    plane.SetOrigin([x, 0.0, 0.0])
+    plane.SetNormal([normal, 0, 0])
+    clip = vtkTableBasedClipDataSet()
+    clip.SetClipFunction(plane)
+    clip.SetInputData(dataset)
+    clip.Update()
+    return clip.GetOutput()
+
+
+def _shift_longitudes(dataset, offset):
+    """Copy of a dataset with its points moved by ``offset`` in longitude."""
+    shifted = vtkUnstructuredGrid()
+    shifted.ShallowCopy(dataset)
+    if offset != 0 and dataset.GetPoints() is not None:
+        coords = numpy_support.vtk_to_numpy(dataset.GetPoints().GetData()).copy()
+        coords[:, 0] += offset
+        points = vtkPoints()
+        points.SetData(numpy_support.numpy_to_vtk(coords, deep=False))
+        shifted.SetPoints(points)
+    return shifted
+
+
+def _merge_pieces(pieces):
+    """
+    Append the pieces of an output. Returns the output without cell data,
+    and the input cell each output cell comes from.
+    """
+    topology = vtkUnstructuredGrid()
+    if len(pieces) == 1:
+        topology.ShallowCopy(pieces[0])
+    elif pieces:
+        append = vtkAppendFilter()
+        for piece in pieces:
+            append.AddInputData(piece)
+        append.Update()
+        topology.ShallowCopy(append.GetOutput())
+    cellMap = topology.GetCellData().GetArray(CELL_IDS)
+    if cellMap is None:
+        cellMap = np.empty(0, dtype=np.int64)
+    else:
+        cellMap = numpy_support.vtk_to_numpy(cellMap).astype(np.int64)
+    topology.GetCellData().Initialize()
+    return topology, cellMap
+
+
+def _copy_with_cell_data(inData, outData, topology, cellMap):
+    """Output a cached topology with the cell data of the current input."""
+    outData.ShallowCopy(topology)
+    outData.GetFieldData().ShallowCopy(inData.GetFieldData())
+    inCellData = inData.GetCellData()
+    outCellData = outData.GetCellData()
+    for i in range(inCellData.GetNumberOfArrays()):
+        array = inCellData.GetArray(i)
+        if array is None:
+            continue
+        values = np.take(numpy_support.vtk_to_numpy(array), cellMap, axis=0)
+        outArray = numpy_support.numpy_to_vtk(values, deep=False)
+        outArray.SetName(array.GetName())
+        outCellData.AddArray(outArray)
+
+
+class TopologyCache:
+    """
+    Output topologies of a filter, without cell data, for its last few
+    (input geometry, parameters) pairs, along with the per-cell bounds of
+    the last input geometry. Only the cell data then changes from one time
+    step, or one level, to the next.
+    """
+
+    def __init__(self, size=4):
+        self._entries = OrderedDict()
+        self._size = size
+        self._bounds_key = None
+        self._bounds = None
+
+    def get(self, inData, params, compute):
+        """
+        Get the (topology, cell map) of the input for the given parameters,
+        calling ``compute(inData, mins, maxs)`` when it is not in cache.
+        """
+        geometry = _geometry_key(inData)
+        key = (geometry, params)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            if geometry != self._bounds_key:
+                self._bounds = _cell_bounds(inData)
+                self._bounds_key = geometry
+            entry = compute(inData, *self._bounds)
+        self._entries[key] = entry
+        while len(self._entries) > self._size:
+            self._entries.popitem(last=False)
+        return entry
+
+
 @smproxy.filter()
 @smproperty.input(name="Input")
 @smdomain.datatype(
@@ -250,6 +441,11 @@ class EAMProject(VTKPythonAlgorithmBase):
         self.__Dims = -1
         self.project = 0
         self.translate = False
+        # Projected points, reused while the input points do not change
+        self._cached_points = None
+        self._cache_key = None
+        # { projection : Transformer } from longitude/latitude
+        self._transformers = {}
 
     def SetTranslation(self, translate):
         if self.translate != translate:
@@ -261,29 +457,10 @@ class EAMProject(VTKPythonAlgorithmBase):
             self.project = int(project)
             self.Modified()
 
-    def RequestData(self, request, inInfo, outInfo):
-        inData = self.GetInputData(inInfo, 0, 0)
-        outData = self.GetOutputData(outInfo, 0)
-        if inData.IsA("vtkPolyData"):
-            afilter = vtkAppendFilter()
-            afilter.AddInputData(inData)
-            afilter.Update()
-            outData.DeepCopy(afilter.GetOutput())
-        else:
-            outData.DeepCopy(inData)
-
-        if self.project == 0:
-            return 1
-
-        inWrap = dsa.WrapDataObject(inData)
-        outWrap = dsa.WrapDataObject(outData)
-        inPoints = np.array(inWrap.Points)
-
-        flat = inPoints.flatten()
-        x = flat[0::3] - 180.0 if self.translate else flat[0::3]
-        y = flat[1::3]
-
-        try:
+    def _get_transformer(self):
+        """Get the cached transformer of the current projection, or create it."""
+        xformer = self._transformers.get(self.project)
+        if xformer is None:
             # Use proj4 string for WGS84 instead of EPSG code to avoid database dependency
             latlon = Proj(proj="latlong", datum="WGS84")
             if self.project == 1:
@@ -292,14 +469,29 @@ class EAMProject(VTKPythonAlgorithmBase):
                 proj = Proj(proj="moll")
             else:
                 # Should not reach here, but return without transformation
-                return 1
+                return None
 
             xformer = Transformer.from_proj(latlon, proj, always_xy=True)
+            self._transformers[self.project] = xformer
+        return xformer
+
+    def _project_points(self, inData):
+        """Project the points of the input, None when the projection fails."""
+        inPoints = np.array(dsa.WrapDataObject(inData).Points)
+
+        flat = inPoints.flatten()
+        x = flat[0::3] - 180.0 if self.translate else flat[0::3]
+        y = flat[1::3]
+
+        try:
+            xformer = self._get_transformer()
+            if xformer is None:
+                return None
             res = xformer.transform(x, y)
         except Exception as e:
             print(f"Projection error: {e}")
             # If projection fails, return without modifying coordinates
-            return 1
+            return None
         flat[0::3] = np.array(res[0])
         flat[1::3] = np.array(res[1])
 
@@ -309,7 +501,35 @@ class EAMProject(VTKPythonAlgorithmBase):
         )
         vtk_coords = vtkPoints()
         vtk_coords.SetData(_coords)
-        outWrap.SetPoints(vtk_coords)
+        return vtk_coords
+
+    def RequestData(self, request, inInfo, outInfo):
+        inData = self.GetInputData(inInfo, 0, 0)
+        outData = self.GetOutputData(outInfo, 0)
+        if inData.IsA("vtkPolyData"):
+            afilter = vtkAppendFilter()
+            afilter.AddInputData(inData)
+            afilter.Update()
+            outData.ShallowCopy(afilter.GetOutput())
+        else:
+            # Points are replaced below, the input is never modified
+            outData.ShallowCopy(inData)
+
+        if self.project == 0 or inData.GetPoints() is None:
+            return 1
+
+        # Cell data changes, e.g. of the time step, keep the input points
+        key = (
+            inData.GetPoints().GetMTime(),
+            inData.GetNumberOfPoints(),
+            self.project,
+            self.translate,
+        )
+        if key != self._cache_key:
+            self._cached_points = self._project_points(inData)
+            self._cache_key = key if self._cached_points is not None else None
+        if self._cached_points is not None:
+            outData.SetPoints(self._cached_points)
 
         return 1
 
@@ -341,6 +561,8 @@ class EAMTransformAndExtract(VTKPythonAlgorithmBase):
         self.project = 0
         self.longrange = [-180.0, 180.0]
         self.latrange = [-90.0, 90.0]
+        # Clipped outputs for the last crop boxes of the last geometries
+        self._cache = TopologyCache()
 
     def SetLongitudeRange(self, min, max):
         if self.longrange[0] != min or self.longrange[1] != max:
@@ -352,56 +574,87 @@ class EAMTransformAndExtract(VTKPythonAlgorithmBase):
             self.latrange = [min, max]
             self.Modified()
 
+    def _classify_cells(self, mins, maxs):
+        """
+        Classify the cells: 1 and 3 for those lying within the crop box west
+        and east of 180, kept whole, 2 for those across its boundary or the
+        antimeridian, to be clipped, and 0 for the cells outside of the box.
+        """
+        (x0, y0, z0), (x1, y1, z1) = mins.T, maxs.T
+        lon0, lon1 = self.longrange
+        lat0, lat1 = self.latrange
+        with np.errstate(invalid="ignore"):
+            inLat = (y0 >= lat0) & (y1 <= lat1) & (z0 >= -1.0) & (z1 <= 1.0)
+            overlapLat = (y0 <= lat1) & (y1 >= lat0) & (z0 <= 1.0) & (z1 >= -1.0)
+            # Cells east of 180 are moved by -360
+            west = (x1 < 180.0) & (x0 >= lon0) & (x1 <= lon1) & inLat
+            east = (x0 > 180.0) & (x0 - 360.0 >= lon0) & (x1 - 360.0 <= lon1) & inLat
+            # Either part of a cell split at the antimeridian may overlap
+            overlap = (x0 <= 180.0) & (x0 <= lon1) & (np.minimum(x1, 180.0) >= lon0)
+            overlap |= (
+                (x1 >= 180.0)
+                & (np.maximum(x0, 180.0) - 360.0 <= lon1)
+                & (x1 - 360.0 >= lon0)
+            )
+            overlap &= overlapLat
+        classes = np.where(overlap, 2, 0).astype(np.uint8)
+        classes[west] = 1
+        classes[east] = 3
+        return classes
+
+    def _split_and_extract(self, inData, mins, maxs):
+        """
+        Move the cells east of 180 by -360 and clip them to the crop box.
+        Only the cells across the box boundary or the antimeridian are
+        actually clipped, the others within the box are extracted whole.
+        """
+        classes = self._classify_cells(mins, maxs)
+        work = _classified_copy(inData, classes)
+
+        pieces = []
+        if (classes == 1).any():
+            pieces.append(_select_class(work, 1))
+        if (classes == 3).any():
+            pieces.append(_shift_longitudes(_select_class(work, 3), -360.0))
+
+        if (classes == 2).any():
+            border = _select_class(work, 2)
+
+            append = vtkAppendFilter()
+            append.AddInputData(_clip_plane(border, 180.0, -1))
+            append.AddInputData(
+                _shift_longitudes(_clip_plane(border, 180.0, 1), -360.0)
+            )
+            append.Update()
+
+            box = vtkPVBox()
+            box.SetReferenceBounds(
+                self.longrange[0],
+                self.longrange[1],
+                self.latrange[0],
+                self.latrange[1],
+                -1.0,
+                1.0,
+            )
+            box.SetUseReferenceBounds(True)
+            extract = vtkPVClipDataSet()
+            extract.SetClipFunction(box)
+            extract.InsideOutOn()
+            extract.ExactBoxClipOn()
+            extract.SetInputData(append.GetOutput())
+            extract.Update()
+            pieces.append(extract.GetOutput())
+
+        return _merge_pieces(pieces)
+
     def RequestData(self, request, inInfo, outInfo):
         inData = self.GetInputData(inInfo, 0, 0)
         outData = self.GetOutputData(outInfo, 0)
 
-        planeL = vtkPlane()
-        planeL.SetOrigin([180.0, 0.0, 0.0])
-        planeL.SetNormal([-1, 0, 0])
-        clipL = vtkTableBasedClipDataSet()
-        clipL.SetClipFunction(planeL)
-        clipL.SetInputData(inData)
-        clipL.Update()
-
-        planeR = vtkPlane()
-        planeR.SetOrigin([180.0, 0.0, 0.0])
-        planeR.SetNormal([1, 0, 0])
-        clipR = vtkTableBasedClipDataSet()
-        clipR.SetClipFunction(planeR)
-        clipR.SetInputData(inData)
-        clipR.Update()
-
-        transFunc = vtkTransform()
-        transFunc.Translate(-360, 0, 0)
-        transform = vtkTransformFilter()
-        transform.SetInputData(clipR.GetOutput())
-        transform.SetTransform(transFunc)
-        transform.Update()
-
-        append = vtkAppendFilter()
-        append.AddInputData(clipL.GetOutput())
-        append.AddInputData(transform.GetOutput())
-        append.Update()
-
-        box = vtkPVBox()
-        box.SetReferenceBounds(
-            self.longrange[0],
-            self.longrange[1],
-            self.latrange[0],
-            self.latrange[1],
-            -1.0,
-            1.0,
-        )
-        box.SetUseReferenceBounds(True)
-        extract = vtkPVClipDataSet()
-        extract.SetClipFunction(box)
-        extract.InsideOutOn()
-        extract.ExactBoxClipOn()
-        extract.SetInputData(append.GetOutput())
-        extract.Update()
-
-        outData.ShallowCopy(extract.GetOutput())
+        # The clips only run for a geometry and crop box not seen lately
+        box = (tuple(self.longrange), tuple(self.latrange))
+        topology, cellMap = self._cache.get(inData, box, self._split_and_extract)
+        _copy_with_cell_data(inData, outData, topology, cellMap)
         return 1
 
 
@@ -426,12 +679,50 @@ class EAMCenterMeridian(VTKPythonAlgorithmBase):
         )
         self.project = 0
         self.cmeridian = 0.0
+        # Recentered outputs for the last meridians of the last geometries
+        self._cache = TopologyCache()
 
     def SetCentralMeridian(self, meridian):
         if self.cmeridian != meridian:
             self.cmeridian = meridian
             self.Modified()
 
+    def _seam(self):
+        """
+        Longitude of the new seam in the input, with the offsets moving the
+        parts west and east of it so that the meridian comes at 0.
+        """
+        if self.cmeridian > 0:
+            split = self.cmeridian - 180
+            return split, 360 - self.cmeridian, -self.cmeridian
+        split = self.cmeridian + 180
+        return split, -self.cmeridian, -360 - self.cmeridian
+
+    def _recenter(self, inData, mins, maxs):
+        """
+        Move the cells on either side of the seam, only the cells across it
+        are actually clipped.
+        """
+        split, westOffset, eastOffset = self._seam()
+        x0, x1 = mins[:, 0], maxs[:, 0]
+        with np.errstate(invalid="ignore"):
+            classes = np.zeros(len(x0), dtype=np.uint8)
+            classes[(x0 < split) & (x1 > split)] = 2
+            classes[x0 >= split] = 3
+            classes[x1 <= split] = 1
+        work = _classified_copy(inData, classes)
+
+        pieces = []
+        if (classes == 1).any():
+            pieces.append(_shift_longitudes(_select_class(work, 1), westOffset))
+        if (classes == 3).any():
+            pieces.append(_shift_longitudes(_select_class(work, 3), eastOffset))
+        if (classes == 2).any():
+            border = _select_class(work, 2)
+            pieces.append(_shift_longitudes(_clip_plane(border, split, -1), westOffset))
+            pieces.append(_shift_longitudes(_clip_plane(border, split, 1), eastOffset))
+        return _merge_pieces(pieces)
+
     def RequestData(self, request, inInfo, outInfo):
         inData = self.GetInputData(inInfo, 0, 0)
         outData = self.GetOutputData(outInfo, 0)
@@ -440,42 +731,8 @@ class EAMCenterMeridian(VTKPythonAlgorithmBase):
             outData.ShallowCopy(inData)
             return 1
 
-        split = (self.cmeridian - 180) if self.cmeridian > 0 else (self.cmeridian + 180)
-
-        planeL = vtkPlane()
-        planeL.SetOrigin([split, 0.0, 0.0])
-        planeL.SetNormal([-1, 0, 0])
-        clipL = vtkTableBasedClipDataSet()
-        clipL.SetClipFunction(planeL)
-        clipL.SetInputData(inData)
-        clipL.Update()
-
-        planeR = vtkPlane()
-        planeR.SetOrigin([split, 0.0, 0.0])
-        planeR.SetNormal([1, 0, 0])
-        clipR = vtkTableBasedClipDataSet()
-        clipR.SetClipFunction(planeR)
-        clipR.SetInputData(inData)
-        clipR.Update()
-
-        transFunc = vtkTransform()
-        transFunc.Translate(360, 0, 0)
-        transform = vtkTransformFilter()
-        transform.SetInputData(clipL.GetOutput())
-        transform.SetTransform(transFunc)
-        transform.Update()
-
-        append = vtkAppendFilter()
-        append.AddInputData(clipR.GetOutput())
-        append.AddInputData(transform.GetOutput())
-        append.Update()
-
-        transFunc = vtkTransform()
-        transFunc.Translate(-(180 + split), 0, 0)
-        transform = vtkTransformFilter()
-        transform.SetInputData(append.GetOutput())
-        transform.SetTransform(transFunc)
-        transform.Update()
-
-        outData.ShallowCopy(transform.GetOutput())
+        # Only the cell data changes as long as the geometry and meridian
+        # do not, e.g. from one time step to the next
+        topology, cellMap = self._cache.get(inData, self.cmeridian, self._recenter)
+        _copy_with_cell_data(inData, outData, topology, cellMap)
         return 1
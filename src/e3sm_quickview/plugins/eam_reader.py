@@ -1,6 +1,6 @@
 from paraview.util.vtkAlgorithm import *
 from vtkmodules.numpy_interface import dataset_adapter as dsa
-from vtkmodules.vtkCommonCore import vtkPoints, vtkDataArraySelection
+from vtkmodules.vtkCommonCore import vtkPoints, vtkDataArraySelection, vtkStringArray
 from vtkmodules.vtkCommonDataModel import vtkUnstructuredGrid, vtkCellArray
 from vtkmodules.util import vtkConstants, numpy_support
 from vtkmodules.util.vtkAlgorithm import VTKPythonAlgorithmBase
@@ -18,6 +18,18 @@ except ImportError as ie:
     )
     _has_deps = False
 
+try:
+    # Optional, enables the parallel decompression of HDF5 chunks
+    import h5py
+except ImportError:
+    h5py = None
+
+try:
+    # Optional, enables the process-based I/O workers
+    from e3sm_quickview.utils.io_workers import SliceRequest, SliceWorkers
+except ImportError:
+    SliceWorkers = None
+
 dims1 = set(["ncol"])
 dims2 = set(["time", "ncol"])
 dims3i = set(["time", "ilev", "ncol"])
@@ -43,6 +55,21 @@ class VarType(Enum):
     _2D = 2
     _3Dm = 3
     _3Di = 4
+    _ND = 5
+
+
+class Track(Enum):
+    TIME = 0
+    MIDPOINT = 1
+    INTERFACE = 2
+
+
+class Reduction(Enum):
+    NONE = 0
+    MEAN = 1
+    MIN = 2
+    MAX = 3
+    STD = 4
 
 
 class VarMeta:
@@ -67,6 +94,13 @@ class VarMeta:
             if "ncol" in dims[1]:
                 self.transpose = True
 
+        # Any other (time, ..., ncol) variable, sliced along its extra dims
+        self.extra_dims = []
+        if self.type is None and "time" in dims and "ncol" in dims:
+            self.type = VarType._ND
+            self.extra_dims = [d for d in dims if d not in ("time", "ncol")]
+        self.dims = tuple(dims)
+
 
 def compare(data, arrays, dim):
     ref = data[arrays[0]][:].flatten()
@@ -119,6 +153,903 @@ def FindSpecialVariable(data, lev, hya, hyb):
             return ldata
 
 
+def FindHybridCoefficients(data, hya, hyb):
+    """
+    Get the (hya * P0, hyb) coefficients of the hybrid vertical coordinate,
+    so that the pressure (in Pa) of a layer is ``hya * P0 + hyb * PS``.
+    Returns None when the data file does not provide them.
+    """
+    var = list(data.variables.keys())
+    _hya = [v for v in var if hya in v]
+    _hyb = [v for v in var if hyb in v]
+    if not _hya or len(_hya) != len(_hyb):
+        return None
+
+    dim = len(data[_hya[0]][:].flatten())
+    coefa = compare(data, _hya, dim)
+    coefb = compare(data, _hyb, dim)
+    if coefa is None or coefb is None:
+        return None
+    p0 = data["P0"][:].item() if "P0" in var else EAMConstants.P0
+    return np.asarray(coefa, dtype=np.float64) * p0, np.asarray(coefb, np.float64)
+
+
+def interpolate_to_pressure(data, pressure, target):
+    """
+    Interpolate every column of ``data`` to the ``target`` pressure, linearly
+    in log-pressure.
+
+    ``data`` and ``pressure`` are (nlev, ncol) arrays, pressure increasing
+    along the layers as in EAM. Columns where the target lies above the top
+    layer or below the bottom layer come out as NaN, a target at the top or
+    bottom layer takes its value.
+    """
+    nlev = pressure.shape[0]
+    # Index of the layer right above the target, in every column
+    upper = (pressure < target).sum(axis=0, keepdims=True) - 1
+    # The top layer is above a target at its own pressure, with weight 0
+    upper[pressure[:1] == target] = 0
+    valid = ((upper >= 0) & (upper < nlev - 1))[0]
+    upper = np.clip(upper, 0, max(0, nlev - 2))
+    lower = np.minimum(upper + 1, nlev - 1)
+
+    p_upper = np.take_along_axis(pressure, upper, axis=0)[0]
+    p_lower = np.take_along_axis(pressure, lower, axis=0)[0]
+    v_upper = np.take_along_axis(data, upper, axis=0)[0]
+    v_lower = np.take_along_axis(data, lower, axis=0)[0]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = np.log(target / p_upper) / np.log(p_lower / p_upper)
+        result = v_upper + weight * (v_lower - v_upper)
+    result[~valid] = np.nan
+    return result.astype(data.dtype, copy=False)
+
+
+import glob  # noqa: E402
+import hashlib  # noqa: E402
+import itertools  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import shutil  # noqa: E402
+import tempfile  # noqa: E402
+import threading  # noqa: E402
+import zlib  # noqa: E402
+from collections import OrderedDict, namedtuple  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+from types import SimpleNamespace  # noqa: E402
+
+
+# Level of a 3D slice interpolated to a pressure (in hPa), instead of a layer
+PressureLevel = namedtuple("PressureLevel", ["hPa"])
+
+# Level of the slice cache keys of whole (lev, ncol) blocks
+ALL_LEVELS = "all"
+
+# Most slices the prefetch reads at once on the I/O workers, an interactive
+# update waits at most for one such batch
+PREFETCH_BATCH = 8
+
+
+class SliceCache:
+    """
+    Least-recently-used cache of cell data arrays bounded by a byte budget.
+
+    Entries are keyed by (file, variable, time index, level index) so that
+    revisiting a slice does not hit the disk again. Entries put in a group,
+    e.g. slices sharing one shared memory block, are evicted together.
+    """
+
+    def __init__(self, budget):
+        self._entries = OrderedDict()
+        # { group : keys } and { key : group } of the grouped entries
+        self._groups = {}
+        self._entry_groups = {}
+        self._lock = threading.Lock()
+        self.budget = budget
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data, group=None):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if data.nbytes > self.budget:
+                return
+            self._entries[key] = data
+            self.nbytes += data.nbytes
+            if group is not None:
+                self._groups.setdefault(group, set()).add(key)
+                self._entry_groups[key] = group
+            self._evict()
+
+    def resize(self, budget):
+        with self._lock:
+            self.budget = budget
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._groups.clear()
+            self._entry_groups.clear()
+            self.nbytes = 0
+
+    def statistics(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "nbytes": self.nbytes,
+                "budget": self.budget,
+            }
+
+    def _remove(self, key):
+        self.nbytes -= self._entries.pop(key).nbytes
+        group = self._entry_groups.pop(key, None)
+        if group is not None:
+            keys = self._groups[group]
+            keys.discard(key)
+            if not keys:
+                del self._groups[group]
+
+    def _evict(self):
+        while self.nbytes > self.budget and self._entries:
+            key = next(iter(self._entries))
+            group = self._entry_groups.get(key)
+            keys = [key] if group is None else list(self._groups[group])
+            for evicted in keys:
+                self._remove(evicted)
+
+
+class RunningStatistics:
+    """
+    Streaming mean, min, max and standard deviation of a series of slices.
+
+    Slices are folded in one at a time with Welford's algorithm, so memory
+    stays at a few slice-sized arrays whatever the length of the series.
+    NaNs are skipped cell by cell, cells without any value come out as NaN.
+    """
+
+    def __init__(self):
+        self.count = None
+
+    def add(self, data):
+        values = np.asarray(data, dtype=np.float64)
+        if self.count is None:
+            self.dtype = data.dtype
+            self.count = np.zeros(values.shape, dtype=np.int64)
+            self.mean = np.zeros(values.shape)
+            self.m2 = np.zeros(values.shape)
+            self.min = np.full(values.shape, np.nan)
+            self.max = np.full(values.shape, np.nan)
+        valid = ~np.isnan(values)
+        self.count += valid
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = np.where(valid, values - self.mean, 0.0)
+            self.mean += np.where(valid, delta / self.count, 0.0)
+            self.m2 += np.where(valid, delta * (values - self.mean), 0.0)
+        np.fmin(self.min, values, out=self.min)
+        np.fmax(self.max, values, out=self.max)
+
+    def result(self, reduction):
+        """Reduced slice, in the precision of the input slices."""
+        if reduction == Reduction.MIN:
+            data = self.min
+        elif reduction == Reduction.MAX:
+            data = self.max
+        else:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                data = (
+                    self.mean if reduction == Reduction.MEAN else self.m2 / self.count
+                )
+            if reduction == Reduction.STD:
+                data = np.sqrt(data)
+            data[self.count == 0] = np.nan
+        return data.astype(self.dtype, copy=False)
+
+
+class ClassicFile:
+    """
+    Memory-mapped access to the variables of a classic netCDF file.
+
+    Supports the CDF-1 (classic), CDF-2 (64-bit offset) and CDF-5 (64-bit
+    data) formats, which store each variable uncompressed at a fixed offset.
+    Only the header is parsed; indexing a variable returns a read-only,
+    big-endian view into the mapped file, so reading a slice costs no more
+    than the pages it touches.
+    """
+
+    MAGIC = (b"CDF\x01", b"CDF\x02", b"CDF\x05")
+    DTYPES = {
+        1: ">i1",
+        2: "S1",
+        3: ">i2",
+        4: ">i4",
+        5: ">f4",
+        6: ">f8",
+        7: ">u1",
+        8: ">u2",
+        9: ">u4",
+        10: ">i8",
+        11: ">u8",
+    }
+    ABSENT, DIMENSION, VARIABLE, ATTRIBUTE = 0, 10, 11, 12
+    # Attributes that netCDF4 would apply when reading (packed data)
+    PACKING = ("scale_factor", "add_offset")
+
+    @classmethod
+    def is_classic(cls, path):
+        with open(path, "rb") as f:
+            return f.read(4) in cls.MAGIC
+
+    def __init__(self, path):
+        self._map = np.memmap(path, dtype=np.uint8, mode="r")
+        self.version = int(self._map[3])
+        self._pos = 4
+        self.packed = False
+
+        numrecs = self._read_count()
+        dims = self._read_dimensions()
+        self._skip_attributes()
+        variables = self._read_variables(dims)
+
+        # Records interleave all the record variables
+        record_vars = [v for v in variables.values() if v["record"]]
+        if len(record_vars) == 1:
+            recsize = record_vars[0]["nbytes"]
+        else:
+            recsize = sum(-(-v["nbytes"] // 4) * 4 for v in record_vars)
+        if record_vars and numrecs in (2**32 - 1, 2**64 - 1):
+            # Streaming file, the record count is not in the header
+            begin = min(v["begin"] for v in record_vars)
+            numrecs = (len(self._map) - begin) // recsize if recsize else 0
+
+        self.variables = {}
+        for name, v in variables.items():
+            dtype = np.dtype(v["dtype"])
+            shape = v["shape"]
+            strides = tuple(
+                int(np.prod(shape[i + 1 :], dtype=np.int64)) * dtype.itemsize
+                for i in range(len(shape))
+            )
+            if v["record"]:
+                shape = (numrecs, *shape[1:])
+                strides = (recsize, *strides[1:])
+            self.variables[name] = np.ndarray(
+                shape, dtype, buffer=self._map, offset=v["begin"], strides=strides
+            )
+
+    def __getitem__(self, name):
+        return self.variables[name]
+
+    def close(self):
+        # Views handed out keep the mapping alive until they are released
+        self.variables = {}
+        self._map = None
+
+    def _read(self, dtype):
+        dtype = np.dtype(dtype)
+        value = self._map[self._pos : self._pos + dtype.itemsize].view(dtype)[0]
+        self._pos += dtype.itemsize
+        return int(value)
+
+    def _read_count(self):
+        # NON_NEG values are 64-bit in CDF-5
+        return self._read(">u8" if self.version == 5 else ">u4")
+
+    def _read_name(self):
+        size = self._read_count()
+        name = bytes(self._map[self._pos : self._pos + size]).decode()
+        self._pos += -(-size // 4) * 4
+        return name
+
+    def _read_list(self, tag):
+        found = self._read(">u4")
+        count = self._read_count()
+        if found not in (self.ABSENT, tag):
+            raise ValueError(f"Unexpected tag {found} in netCDF header")
+        return count
+
+    def _read_dimensions(self):
+        dims = []
+        for _ in range(self._read_list(self.DIMENSION)):
+            self._read_name()
+            dims.append(self._read_count())
+        return dims
+
+    def _skip_attributes(self):
+        names = []
+        for _ in range(self._read_list(self.ATTRIBUTE)):
+            names.append(self._read_name())
+            itemsize = np.dtype(self.DTYPES[self._read(">u4")]).itemsize
+            nbytes = self._read_count() * itemsize
+            self._pos += -(-nbytes // 4) * 4
+        return names
+
+    def _read_variables(self, dims):
+        variables = {}
+        for _ in range(self._read_list(self.VARIABLE)):
+            name = self._read_name()
+            dimids = [self._read_count() for _ in range(self._read_count())]
+            if any(att in self.PACKING for att in self._skip_attributes()):
+                self.packed = True
+            dtype = self.DTYPES[self._read(">u4")]
+            self._read_count()  # vsize, recomputed below as it may overflow
+            begin = self._read(">u4" if self.version == 1 else ">u8")
+
+            shape = tuple(dims[i] for i in dimids)
+            record = len(shape) > 0 and shape[0] == 0
+            nbytes = int(np.prod(shape[1:] if record else shape, dtype=np.int64))
+            variables[name] = {
+                "shape": shape,
+                "dtype": dtype,
+                "begin": begin,
+                "record": record,
+                "nbytes": nbytes * np.dtype(dtype).itemsize,
+            }
+        return variables
+
+
+class ChunkedVariable:
+    """
+    Hyperslab reads of a chunked HDF5 dataset, decompressed in parallel.
+
+    The raw bytes of the chunks covering the request are fetched with
+    ``read_direct_chunk`` and handed to a thread pool which inflates them
+    (zlib releases the GIL), undoes the shuffle filter and copies each one
+    straight into its region of a preallocated output array. Datasets using
+    other filters, or strided requests, are read through h5py as usual.
+    """
+
+    DEFLATE, SHUFFLE, FLETCHER32 = 1, 2, 3
+
+    def __init__(self, dataset, executor):
+        self._dataset = dataset
+        self._executor = executor
+        self.shape = dataset.shape
+        self.dtype = dataset.dtype
+        self.chunks = dataset.chunks
+
+        plist = dataset.id.get_create_plist()
+        self._filters = [plist.get_filter(i)[0] for i in range(plist.get_nfilters())]
+        self._direct = self.chunks is not None and set(self._filters) <= {
+            self.DEFLATE,
+            self.SHUFFLE,
+            self.FLETCHER32,
+        }
+
+    def __getitem__(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        if Ellipsis in key or len(key) > len(self.shape):
+            return self._dataset[key]
+        key = key + (slice(None),) * (len(self.shape) - len(key))
+
+        starts, stops, shape = [], [], []
+        for k, size in zip(key, self.shape):
+            if isinstance(k, slice):
+                start, stop, step = k.indices(size)
+                if step != 1:
+                    return self._dataset[key]
+                stop = max(start, stop)
+                shape.append(stop - start)
+            else:
+                # Records past the extent of the dataset read as fill values
+                start = int(k) + size if int(k) < 0 else int(k)
+                if start < 0:
+                    raise IndexError(f"Index {k} out of range for size {size}")
+                stop = start + 1
+            starts.append(start)
+            stops.append(stop)
+
+        out = np.empty(
+            [b - a for a, b in zip(starts, stops)], self.dtype.newbyteorder("=")
+        )
+        if out.size == 0:
+            return out.reshape(shape)
+        if not self._direct:
+            out[...] = self._dataset[tuple(map(slice, starts, stops))]
+            return out.reshape(shape)
+
+        # Chunk origins covering the request, raw bytes are read serially
+        ranges = [
+            range(a // c * c, b, c) for a, b, c in zip(starts, stops, self.chunks)
+        ]
+        futures = []
+        for origin in itertools.product(*ranges):
+            mask, raw = None, None  # unallocated chunk
+            if self._dataset.id.get_chunk_info_by_coord(origin).byte_offset is not None:
+                mask, raw = self._dataset.id.read_direct_chunk(origin)
+            futures.append(
+                self._executor.submit(
+                    self._decode, origin, mask, raw, starts, stops, out
+                )
+            )
+        for future in futures:
+            future.result()
+        return out.reshape(shape)
+
+    def _decode(self, origin, mask, raw, starts, stops, out):
+        src, dst = [], []
+        for o, c, a, b in zip(origin, self.chunks, starts, stops):
+            lo, hi = max(a, o), min(b, o + c)
+            src.append(slice(lo - o, hi - o))
+            dst.append(slice(lo - a, hi - a))
+
+        if raw is None:
+            fill = self._dataset.fillvalue
+            out[tuple(dst)] = fill if fill is not None else 0
+            return
+
+        itemsize = self.dtype.itemsize
+        for i in reversed(range(len(self._filters))):
+            if mask & (1 << i):
+                continue  # filter skipped for this chunk
+            if self._filters[i] == self.DEFLATE:
+                raw = zlib.decompress(raw)
+            elif self._filters[i] == self.SHUFFLE and itemsize > 1:
+                raw = self._unshuffle(raw, itemsize)
+            elif self._filters[i] == self.FLETCHER32:
+                raw = raw[:-4]
+        chunk = np.frombuffer(raw, self.dtype).reshape(self.chunks)
+        out[tuple(dst)] = chunk[tuple(src)]
+
+    @staticmethod
+    def _unshuffle(raw, itemsize):
+        # Trailing bytes that do not fill a whole element are not shuffled
+        data = np.frombuffer(raw, np.uint8)
+        count = len(data) // itemsize
+        out = np.empty_like(data)
+        # One strided copy per byte plane is much faster than a transpose
+        elements = out[: count * itemsize].reshape(count, itemsize)
+        planes = data[: count * itemsize].reshape(itemsize, count)
+        for byte in range(itemsize):
+            elements[:, byte] = planes[byte]
+        out[count * itemsize :] = data[count * itemsize :]
+        return out
+
+
+class ChunkedFile:
+    """HDF5 based netCDF file whose variables are read as ChunkedVariable."""
+
+    MAGIC = b"\x89HDF\r\n\x1a\n"
+
+    @classmethod
+    def is_hdf5(cls, path):
+        with open(path, "rb") as f:
+            return f.read(8) == cls.MAGIC
+
+    def __init__(self, path, executor):
+        self._file = h5py.File(path, "r")
+        self._executor = executor
+        self._variables = {}
+
+    def __getitem__(self, name):
+        variable = self._variables.get(name)
+        if variable is None:
+            variable = ChunkedVariable(self._file[name], self._executor)
+            self._variables[name] = variable
+        return variable
+
+    def close(self):
+        self._variables.clear()
+        self._file.close()
+
+
+class FileSeries:
+    """
+    Ordered group of history files presented as one continuous time axis.
+
+    The data file name may be a single file or a glob pattern such as
+    ``case.eam.h0.*.nc``. Only the time coordinate of each file is read up
+    front; datasets are then opened on demand and kept in a bounded pool of
+    open handles. The first file, which provides the metadata shared by the
+    group, stays open outside of the pool.
+
+    With ``mmap`` enabled, classic format files (CDF-1/2/5) are read through
+    a :class:`ClassicFile` memory map rather than netCDF4. With
+    ``decompress_threads`` set and h5py available, HDF5 based files are read
+    through a :class:`ChunkedFile` instead. Other files, and files holding
+    packed variables, still go through netCDF4.
+    """
+
+    def __init__(
+        self,
+        pattern,
+        max_open=16,
+        mmap=True,
+        decompress_threads=0,
+        file_times=None,
+        packed=None,
+    ):
+        self.paths = self.expand(pattern)
+        self.max_open = max_open
+        self.mmap = mmap
+        self._decompress_executor = None
+        if decompress_threads > 0 and h5py is not None:
+            self._decompress_executor = ThreadPoolExecutor(
+                max_workers=decompress_threads, thread_name_prefix="EAMInflate"
+            )
+        self._first = self._open_dataset(self.paths[0])
+        self._handles = OrderedDict()
+        # Files of a group share their variables, netCDF4 unpacks the packed ones
+        if packed is None:
+            packed = any(
+                att in variable.ncattrs()
+                for variable in self._first.variables.values()
+                for att in ClassicFile.PACKING
+            )
+        self.packed = packed
+        # The first file only goes through the pool when read by another backend
+        direct = self._open_direct(self.paths[0])
+        if direct is not None:
+            self._handles[self.paths[0]] = direct
+        self._first_direct = direct is not None
+
+        # Time coordinate of each file, unless known from a previous session
+        if file_times is None:
+            file_times = [self._read_times(path) for path in self.paths]
+        self.file_times = [np.asarray(t, dtype=np.float64) for t in file_times]
+        self._update_times()
+        # Size and mtime of the last file, which grows while a run is writing
+        self._last_stat = self._stat(self.paths[-1])
+
+    def _read_times(self, path):
+        data = np.ma.getdata(self.open(path)["time"][:])
+        return np.asarray(data, dtype=np.float64).reshape(-1)
+
+    def _update_times(self):
+        self.times = np.concatenate(self.file_times)
+        self._starts = np.cumsum([0] + [len(t) for t in self.file_times])
+
+    @staticmethod
+    def _stat(path):
+        info = os.stat(path)
+        return info.st_size, info.st_mtime_ns
+
+    @staticmethod
+    def expand(pattern):
+        """Sorted list of the files matching a file name or glob pattern."""
+        paths = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else []
+        return paths or [pattern]
+
+    def __len__(self):
+        return len(self.times)
+
+    def open(self, path):
+        """Get an open dataset from the pool, opening it if needed."""
+        if path == self.paths[0] and not self._first_direct:
+            return self._first
+        dataset = self._handles.get(path)
+        if dataset is None:
+            dataset = self._open_direct(path)
+            if dataset is None:
+                dataset = self._open_dataset(path)
+            self._handles[path] = dataset
+            while len(self._handles) > self.max_open:
+                _, evicted = self._handles.popitem(last=False)
+                evicted.close()
+        else:
+            self._handles.move_to_end(path)
+        return dataset
+
+    def _open_dataset(self, path):
+        dataset = netCDF4.Dataset(path, "r")
+        # Read plain arrays, fill values are replaced with NaN by the reader
+        dataset.set_auto_mask(False)
+        return dataset
+
+    def _open_direct(self, path):
+        """Open a file with the memory map or chunk backend if applicable."""
+        try:
+            if self.mmap and ClassicFile.is_classic(path):
+                dataset = ClassicFile(path)
+                if not dataset.packed:
+                    return dataset
+                dataset.close()
+            elif (
+                self._decompress_executor is not None
+                and not self.packed
+                and ChunkedFile.is_hdf5(path)
+            ):
+                return ChunkedFile(path, self._decompress_executor)
+        except (OSError, ValueError, KeyError, IndexError):
+            pass
+        return None
+
+    def first(self):
+        """Dataset used for the metadata shared by all the files."""
+        return self._first
+
+    def changed(self, pattern):
+        """
+        Cheap check, from the file sizes and modification times and without
+        touching the open handles, for time steps written since the files
+        were opened or last refreshed.
+        """
+        paths = self.expand(pattern)
+        if paths[: len(self.paths)] != self.paths:
+            return False
+        return len(paths) > len(self.paths) or (
+            self._stat(self.paths[-1]) != self._last_stat
+        )
+
+    def refresh(self, pattern):
+        """
+        Pick up the time steps written since the files were opened, either
+        appended to the last file or as new files of the group. Only the
+        handle of the file that grew is reopened, since open handles do not
+        see new records. Returns whether the time axis grew.
+        """
+        paths = self.expand(pattern)
+        if paths[: len(self.paths)] != self.paths:
+            # Files were removed or renamed, not a growing series
+            return False
+        last = self.paths[-1]
+        stat = self._stat(last)
+        new_paths = paths[len(self.paths) :]
+        if stat == self._last_stat and not new_paths:
+            return False
+
+        count = len(self.times)
+        if stat != self._last_stat:
+            self._reopen(last)
+            self.file_times[-1] = self._read_times(last)
+        for path in new_paths:
+            self.paths.append(path)
+            self.file_times.append(self._read_times(path))
+        self._update_times()
+        self._last_stat = self._stat(self.paths[-1])
+        return len(self.times) > count
+
+    def _reopen(self, path):
+        """Drop the open handles of a file, the next access reopens it."""
+        dataset = self._handles.pop(path, None)
+        if dataset is not None:
+            dataset.close()
+        if path == self.paths[0]:
+            self._first.close()
+            self._first = self._open_dataset(path)
+
+    def locate(self, timeInd):
+        """Map a global time index to (file path, time index within file)."""
+        fileInd = int(np.searchsorted(self._starts, timeInd, side="right")) - 1
+        return self.paths[fileInd], int(timeInd - self._starts[fileInd])
+
+    def resize(self, max_open):
+        self.max_open = max(1, max_open)
+        while len(self._handles) > self.max_open:
+            _, evicted = self._handles.popitem(last=False)
+            evicted.close()
+
+    def close(self):
+        for dataset in [self._first, *self._handles.values()]:
+            try:
+                dataset.close()
+            except Exception:
+                pass
+        if self._decompress_executor is not None:
+            self._decompress_executor.shutdown(wait=False)
+        self._handles.clear()
+
+
+def file_fingerprint(path, sample=1024 * 1024):
+    """
+    Identify the content of a file without reading all of it.
+
+    The digest combines the absolute path, size and modification time with a
+    hash of the first and last ``sample`` bytes, so that a file rewritten in
+    place gets a new fingerprint even if its mtime is preserved.
+    """
+    path = os.path.abspath(path)
+    info = os.stat(path)
+    digest = hashlib.sha1()
+    digest.update(f"{path}:{info.st_size}:{info.st_mtime_ns}".encode())
+    with open(path, "rb") as f:
+        digest.update(f.read(sample))
+        if info.st_size > sample:
+            f.seek(max(sample, info.st_size - sample))
+            digest.update(f.read(sample))
+    return digest.hexdigest()
+
+
+def merge_coincident_points(coords, tolerance=1e-9):
+    """
+    Collapse points that coincide within ``tolerance`` into shared vertices.
+
+    Returns the unique points, in order of first occurrence, and for every
+    input point the index of the vertex it was merged into.
+    """
+    keys = np.ascontiguousarray(np.round(coords / tolerance).astype(np.int64))
+    keys = keys.view(np.dtype((np.void, keys.itemsize * keys.shape[1]))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    # np.unique sorts by key, renumber vertices by first occurrence instead
+    order = np.argsort(first)
+    renumber = np.empty_like(order)
+    renumber[order] = np.arange(len(order))
+    return coords[first[order]], renumber[inverse.ravel()].astype(np.int64)
+
+
+def cell_bounds(arrays):
+    """Per-cell (lon min, lon max, lat min, lat max) of the quads of a mesh."""
+    corners = arrays["points"][arrays["connectivity"], :2].reshape(-1, 4, 2)
+    lon, lat = corners[..., 0], corners[..., 1]
+    return np.stack(
+        (lon.min(axis=1), lon.max(axis=1), lat.min(axis=1), lat.max(axis=1)),
+        axis=1,
+    )
+
+
+def hilbert_index(x, y, bits=16):
+    """
+    Distance along a Hilbert curve filling the unit square of points with
+    ``x`` and ``y`` in [0, 1], on a 2**bits x 2**bits grid.
+    """
+    n = 1 << bits
+    x = np.clip((np.asarray(x) * (n - 1)).astype(np.int64), 0, n - 1)
+    y = np.clip((np.asarray(y) * (n - 1)).astype(np.int64), 0, n - 1)
+    d = np.zeros(x.shape, dtype=np.int64)
+    s = n >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx.astype(np.int64)) ^ ry)
+        # Rotate the quadrant so that the curve stays continuous
+        flip = ~ry & rx
+        x = np.where(flip, n - 1 - x, x)
+        y = np.where(flip, n - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s >>= 1
+    return d
+
+
+def hilbert_order(arrays):
+    """
+    Permutation sorting the cells of a mesh along a Hilbert curve in
+    longitude/latitude, so that neighboring cells are stored close together.
+    """
+    west, east, south, north = cell_bounds(arrays).T
+    # Cells across the 0/360 meridian span almost all longitudes
+    lon = np.where(
+        east - west > 180.0, (west + east + 360.0) / 2.0, (west + east) / 2.0
+    )
+    lon = np.mod(lon, 360.0)
+    lat = (south + north) / 2.0
+    return np.argsort(hilbert_index(lon / 360.0, (lat + 90.0) / 180.0), kind="stable")
+
+
+def reorder_cells(arrays, order):
+    """
+    Mesh arrays with the cells permuted by ``order`` and the points numbered
+    in order of first use. ``cell_order`` keeps, for every cell, its index in
+    the connectivity file.
+    """
+    cells = arrays["connectivity"].reshape(-1, 4)[order].reshape(-1)
+    used, first, inverse = np.unique(cells, return_index=True, return_inverse=True)
+    rank = np.argsort(first)
+    renumber = np.empty_like(rank)
+    renumber[rank] = np.arange(len(rank))
+    return {
+        "points": arrays["points"][used[rank]],
+        "offsets": arrays["offsets"],
+        "connectivity": renumber[inverse.ravel()].astype(np.int64),
+        "cell_types": arrays["cell_types"][order],
+        "cell_order": order.astype(np.int64),
+    }
+
+
+class GeometryCache:
+    """
+    On-disk cache of the mesh arrays built from a connectivity file.
+
+    Each connectivity file maps to a sub-directory named after its
+    fingerprint holding one ``.npy`` file per array. Cached arrays are memory
+    mapped read-only, so reopening a known grid skips mesh construction and
+    only pages in what VTK touches.
+    """
+
+    # Arrays of every entry, variants may store additional ones
+    ARRAYS = ("points", "offsets", "connectivity", "cell_types")
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _entry(self, path, variant=None):
+        name = file_fingerprint(path)
+        if variant:
+            name = f"{name}-{variant}"
+        return os.path.join(self.directory, name)
+
+    def load(self, path, variant=None):
+        """Memory map the cached arrays of ``path``, None when not cached."""
+        try:
+            entry = self._entry(path, variant)
+            names = [f[:-4] for f in os.listdir(entry) if f.endswith(".npy")]
+            if not set(self.ARRAYS) <= set(names):
+                return None
+            return {
+                name: np.load(os.path.join(entry, f"{name}.npy"), mmap_mode="r")
+                for name in names
+            }
+        except (OSError, ValueError):
+            return None
+
+    def save(self, path, arrays, variant=None):
+        """Write the arrays of ``path``, other processes never see partial entries."""
+        entry = self._entry(path, variant)
+        os.makedirs(self.directory, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".tmp-", dir=self.directory)
+        try:
+            for name, array in arrays.items():
+                np.save(os.path.join(staging, f"{name}.npy"), array)
+            os.replace(staging, entry)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.isdir(entry):
+                raise
+
+
+class MetadataCatalog:
+    """
+    On-disk catalog of the metadata extracted from data files.
+
+    Entries are JSON documents keyed by the fingerprints of the file(s) they
+    describe, so that reopening a known file, or group of files, does not
+    walk its header again.
+    """
+
+    VERSION = 2
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _entry(self, paths):
+        digest = hashlib.sha1()
+        for path in paths:
+            # The header is at the start of the file, a small sample is enough
+            digest.update(file_fingerprint(path, sample=64 * 1024).encode())
+        return os.path.join(self.directory, f"{digest.hexdigest()}.json")
+
+    def load(self, paths):
+        """Get the catalog entry of ``paths``, None when not cataloged."""
+        try:
+            with open(self._entry(paths)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get("version") == self.VERSION else None
+
+    def save(self, paths, entry):
+        """Write the catalog entry of ``paths`` atomically."""
+        path = self._entry(paths)
+        os.makedirs(self.directory, exist_ok=True)
+        fd, staging = tempfile.mkstemp(prefix=".tmp-", dir=self.directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": self.VERSION, **entry}, f)
+            os.replace(staging, path)
+        except OSError:
+            os.unlink(staging)
+            raise
+
+
 # ------------------------------------------------------------------------------
 # A reader example.
 # ------------------------------------------------------------------------------
@@ -153,7 +1084,7 @@ import traceback  # noqa: E402
                       label="Data File"
                       number_of_elements="1">
                     <FileListDomain name="files" />
-                    <Documentation>Specify the NetCDF data file name.</Documentation>
+                    <Documentation>Specify the NetCDF data file name, or a glob pattern (e.g. case.eam.h0.*.nc) to read a group of files as one time series.</Documentation>
                 </StringVectorProperty>
                 """
 )
@@ -168,6 +1099,73 @@ import traceback  # noqa: E402
                 </StringVectorProperty>
                 """
 )
+@smproperty.xml(
+    """
+                <StringVectorProperty name="DimensionIndices"
+                      label="Dimension Indices"
+                      command="SetDimensionIndex"
+                      clean_command="ClearDimensionIndices"
+                      number_of_elements="0"
+                      number_of_elements_per_command="2"
+                      repeat_command="1">
+                    <Documentation>(dimension, index) pairs selecting the slice of the other variables along their extra dimensions. Unlisted dimensions use index 0.</Documentation>
+                </StringVectorProperty>
+                <StringVectorProperty name="ExtraDimensionsInfo"
+                      command="GetExtraDimensionsInfo"
+                      information_only="1">
+                    <StringArrayHelper />
+                    <Documentation>(variable, dimension, size) triplets of the extra dimensions of the other variables.</Documentation>
+                </StringVectorProperty>
+                <StringVectorProperty command="SetMetadataCacheDirectory"
+                      name="MetadataCacheDirectory"
+                      label="Metadata Cache Directory"
+                      number_of_elements="1"
+                      default_values="">
+                    <Documentation>Directory where the variables, time axis and levels of the data files are cataloged and reused across sessions. Leave empty to disable.</Documentation>
+                </StringVectorProperty>
+                <StringVectorProperty command="SetGeometryCacheDirectory"
+                      name="GeometryCacheDirectory"
+                      label="Geometry Cache Directory"
+                      number_of_elements="1"
+                      default_values="">
+                    <Documentation>Directory where the mesh built from a connectivity file is stored and reused across sessions. Leave empty to disable.</Documentation>
+                </StringVectorProperty>
+                """
+)
+@smproperty.xml(
+    """
+                <DoubleVectorProperty name="Longitude Range"
+                      command="SetLongitudeRange"
+                      number_of_elements="2"
+                      default_values="-180 180">
+                    <Documentation>Only the cells overlapping this longitude range are read.</Documentation>
+                </DoubleVectorProperty>
+                <DoubleVectorProperty name="Latitude Range"
+                      command="SetLatitudeRange"
+                      number_of_elements="2"
+                      default_values="-90 90">
+                    <Documentation>Only the cells overlapping this latitude range are read.</Documentation>
+                </DoubleVectorProperty>
+                """
+)
+@smproperty.xml(
+    """
+                <IntVectorProperty name="Merge Points"
+                    command="SetMergePoints"
+                    number_of_elements="1"
+                    default_values="0">
+                    <BooleanDomain name="bool"/>
+                    <Documentation>Merge the coincident corners of neighboring cells into shared points. Cell data is unchanged.</Documentation>
+                </IntVectorProperty>
+                <IntVectorProperty name="Reorder Cells"
+                    command="SetReorderCells"
+                    number_of_elements="1"
+                    default_values="0">
+                    <BooleanDomain name="bool"/>
+                    <Documentation>Output the cells sorted along a Hilbert curve in longitude/latitude instead of the order of the connectivity file, so that neighboring cells are stored close together. Cell data is permuted accordingly.</Documentation>
+                </IntVectorProperty>
+                """
+)
 @smproperty.xml(
     """
                 <IntVectorProperty name="Middle Layer"
@@ -186,6 +1184,122 @@ import traceback  # noqa: E402
                 </IntVectorProperty>
                 """
 )
+@smproperty.xml(
+    """
+                <DoubleVectorProperty name="Pressure Level"
+                    command="SetPressureLevel"
+                    number_of_elements="1"
+                    default_values="0">
+                    <Documentation>Slice the 3D variables at this pressure (in hPa) instead of a model layer, interpolating every column linearly in log-pressure from the surface pressure (PS) and the hybrid coefficients. 0 slices the model layers.</Documentation>
+                </DoubleVectorProperty>
+                """
+)
+@smproperty.xml(
+    """
+                <IntVectorProperty name="Time Reduction"
+                    command="SetTimeReduction"
+                    number_of_elements="1"
+                    default_values="0">
+                    <EnumerationDomain name="enum">
+                        <Entry value="0" text="None"/>
+                        <Entry value="1" text="Mean"/>
+                        <Entry value="2" text="Minimum"/>
+                        <Entry value="3" text="Maximum"/>
+                        <Entry value="4" text="Standard Deviation"/>
+                    </EnumerationDomain>
+                    <Documentation>Output a reduction of the enabled variables over the time reduction range instead of a single time step.</Documentation>
+                </IntVectorProperty>
+                <IntVectorProperty name="Time Reduction Range"
+                    command="SetTimeReductionRange"
+                    number_of_elements="2"
+                    default_values="0 0">
+                    <Documentation>First and last time step indices (inclusive) of the time reduction.</Documentation>
+                </IntVectorProperty>
+                """
+)
+@smproperty.xml(
+    """
+                <IntVectorProperty name="Prefetch Depth"
+                    command="SetPrefetchDepth"
+                    number_of_elements="1"
+                    default_values="0">
+                    <Documentation>Number of upcoming slices to load in the background.</Documentation>
+                </IntVectorProperty>
+                <IntVectorProperty name="Prefetch Track"
+                    command="SetPrefetchTrack"
+                    number_of_elements="1"
+                    default_values="0">
+                    <EnumerationDomain name="enum">
+                        <Entry value="0" text="Time"/>
+                        <Entry value="1" text="Middle Layer"/>
+                        <Entry value="2" text="Interface Layer"/>
+                    </EnumerationDomain>
+                </IntVectorProperty>
+                <IntVectorProperty name="Prefetch Direction"
+                    command="SetPrefetchDirection"
+                    number_of_elements="1"
+                    default_values="1">
+                </IntVectorProperty>
+                """
+)
+@smproperty.xml(
+    """
+                <IntVectorProperty name="Max Open Files"
+                    command="SetMaxOpenFiles"
+                    number_of_elements="1"
+                    default_values="16">
+                    <Documentation>Number of data files of a group kept open at once.</Documentation>
+                </IntVectorProperty>
+                """
+)
+@smproperty.xml(
+    """
+                <IntVectorProperty name="Memory Map"
+                    command="SetMemoryMap"
+                    number_of_elements="1"
+                    default_values="1">
+                    <BooleanDomain name="bool"/>
+                    <Documentation>Read classic format (CDF-1, CDF-2 and CDF-5) data files through a memory map instead of netCDF4.</Documentation>
+                </IntVectorProperty>
+                """
+)
+@smproperty.xml(
+    """
+                <IntVectorProperty name="Parallel Decompression"
+                    command="SetParallelDecompression"
+                    number_of_elements="1"
+                    default_values="0">
+                    <BooleanDomain name="bool"/>
+                    <Documentation>Read compressed netCDF4/HDF5 data files chunk by chunk and decompress the chunks on the worker threads. Requires h5py.</Documentation>
+                </IntVectorProperty>
+                """
+)
+@smproperty.xml(
+    """
+                <IntVectorProperty name="Worker Threads"
+                    command="SetWorkerThreads"
+                    number_of_elements="1"
+                    default_values="4">
+                    <Documentation>Number of threads used to load the enabled variables.</Documentation>
+                </IntVectorProperty>
+                <IntVectorProperty name="IO Processes"
+                    command="SetIOProcesses"
+                    number_of_elements="1"
+                    default_values="0">
+                    <Documentation>Number of processes reading the slices of netCDF4/HDF5 data files in parallel, into shared memory. 0 reads them in the reader process. Requires the e3sm_quickview package.</Documentation>
+                </IntVectorProperty>
+                """
+)
+@smproperty.xml(
+    """
+                <IntVectorProperty name="Cache Size"
+                    command="SetCacheSize"
+                    number_of_elements="1"
+                    default_values="1024">
+                    <Documentation>Memory budget (in MB) for recently loaded slices.</Documentation>
+                </IntVectorProperty>
+                """
+)
 class EAMSliceSource(VTKPythonAlgorithmBase):
     def __init__(self):
         VTKPythonAlgorithmBase.__init__(
@@ -199,16 +1313,34 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
         self._surface_update = True
         self._midpoint_update = True
         self._interface_update = True
+        self._other_update = True
 
         # Variables for dimension sliders
         self._time = 0
         self._lev = 0
         self._ilev = 0
+        # Index along each extra dimension of the other variables
+        self._dim_indices = {}
+        # Size of the extra dimensions { name : size }
+        self._dim_sizes = {}
+        # Pressure (hPa) the 3D variables are interpolated to, 0 when disabled
+        self._pressure_level = 0.0
+        # Temporal reduction replacing the current time step when enabled
+        self._time_reduction = Reduction.NONE
+        self._reduction_range = [0, 0]
+        # Crop box, only the cells overlapping it are read and output
+        self._longitude_range = [-180.0, 180.0]
+        self._latitude_range = [-90.0, 90.0]
+        self._cell_ids = None  # selected cells, None when all are selected
+        self._file_ids = None  # file column of each output cell, None if same
+        self._columns = None  # (start, stop) column range holding the cells
+        self._column_index = None  # cells within the range, None if contiguous
         # Arrays to store field names in netCDF file
         self._info_vars = []  # 1D info variables
         self._surface_vars = []  # 2D surface variables
         self._interface_vars = []  # 3D interface layer variables
         self._midpoint_vars = []  # 3D midpoint layer variables
+        self._other_vars = []  # variables with extra dimensions
         self._timeSteps = []
 
         # vtkDataArraySelection to allow users choice for fields
@@ -217,6 +1349,7 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
         self._surface_selection = vtkDataArraySelection()
         self._interface_selection = vtkDataArraySelection()
         self._midpoint_selection = vtkDataArraySelection()
+        self._other_selection = vtkDataArraySelection()
         # Cache for non temporal variables
         # Store { names : data }
         self._info_vars_cache = {}
@@ -231,29 +1364,89 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
         self._midpoint_selection.AddObserver(
             "ModifiedEvent", createModifiedCallback(self)
         )
+        self._other_selection.AddObserver("ModifiedEvent", createModifiedCallback(self))
         # Flag for area var to calculate averages
         self._areavar = None
+        # Surface pressure, needed to interpolate to pressure levels
+        self._psvar = None
 
         # NetCDF file handle caching
         self._mesh_dataset = None
-        self._var_dataset = None
         self._cached_mesh_filename = None
-        self._cached_var_filename = None
+        # Data file(s) with their concatenated time axis
+        self._series = None
+        self._max_open_files = 16
+        # Read classic format files through a memory map
+        self._memory_map = True
+        # Decompress the HDF5 chunks of a slice on the worker threads
+        self._parallel_decompression = False
 
         # Geometry caching
         self._cached_points = None
-        self._cached_cells = None
         self._cached_cell_types = None
-        self._cached_offsets = None
+        self._cached_cell_array = None
         self._cached_ncells2D = None
+        # Output geometry and cell selection of the last crop boxes, reused
+        # when going back to a box { (lon range, lat range) : namespace }
+        self._crop_geometry = OrderedDict()
+        self._max_crop_boxes = 4
+        # Mesh arrays of the whole grid, the output may only use a subset
+        self._geometry_arrays = None
+        # Per-cell (lon min, lon max, lat min, lat max) used for cropping
+        self._cached_cell_bounds = None
+        # Persistent geometry shared across sessions
+        self._geometry_cache = None
+        # Persistent metadata of the data files, read when the file changes
+        self._metadata_catalog = None
+        self._catalog_entry = None
+        self._metadata_dirty = False
+        # Share the corners of neighboring cells instead of 4 points per cell
+        self._merge_points = False
+        # Sort the cells along a Hilbert curve instead of the file order
+        self._reorder_cells = False
 
         # Special variable caching
         self._cached_lev = None
         self._cached_ilev = None
         self._cached_area = None
+        # { hya name : (hya * P0, hyb) } hybrid coordinate coefficients
+        self._cached_hybrid = {}
+
+        # Slice caching { (file, variable, time, level) : data }, along with
+        # the (lev, ncol) blocks whose layers are served as views of them
+        # while scrubbing, under the ALL_LEVELS level
+        self._slice_cache = SliceCache(1024 * 1024 * 1024)
+        self._level_changed = False
+
+        # Background prefetch of upcoming slices
+        self._prefetch_depth = 0
+        self._prefetch_track = Track.TIME
+        self._prefetch_direction = 1
+        self._prefetch_generation = 0
+        self._prefetch_executor = None
+        # Serializes netCDF access between RequestData and the prefetch thread
+        self._io_lock = threading.Lock()
+
+        # Parallel loading of the enabled variables
+        self._worker_threads = 4
+        self._load_executor = None
+        # netCDF-C is not thread safe, reads are serialized across workers
+        self._netcdf_lock = threading.Lock()
+        # Processes reading netCDF4/HDF5 slices, without the lock (0 disables)
+        self._io_processes = 0
+        self._io_workers = None
+        # Group of the slices of each batch read on the I/O workers
+        self._worker_batches = itertools.count()
 
     def __del__(self):
         """Clean up NetCDF file handles on deletion."""
+        self._cancel_prefetch()
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        if self._load_executor is not None:
+            self._load_executor.shutdown(wait=False)
+        if self._io_workers is not None:
+            self._io_workers.close()
         self._close_datasets()
 
     def _close_datasets(self):
@@ -264,12 +1457,9 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
             except Exception:
                 pass
             self._mesh_dataset = None
-        if self._var_dataset is not None:
-            try:
-                self._var_dataset.close()
-            except Exception:
-                pass
-            self._var_dataset = None
+        if self._series is not None:
+            self._series.close()
+            self._series = None
 
     def _get_mesh_dataset(self):
         """Get cached mesh dataset or open a new one."""
@@ -287,16 +1477,18 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
         return self._mesh_dataset
 
     def _get_var_dataset(self):
-        """Get cached variable dataset or open a new one."""
-        if self._DataFileName != self._cached_var_filename or self._var_dataset is None:
-            if self._var_dataset is not None:
-                try:
-                    self._var_dataset.close()
-                except Exception:
-                    pass
-            self._var_dataset = netCDF4.Dataset(self._DataFileName, "r")
-            self._cached_var_filename = self._DataFileName
-        return self._var_dataset
+        """Get the dataset holding the metadata of the data file(s)."""
+        if self._series is None:
+            entry = self._catalog_entry or {}
+            self._series = FileSeries(
+                self._DataFileName,
+                self._max_open_files,
+                self._memory_map,
+                self._worker_threads if self._parallel_decompression else 0,
+                entry.get("file_times"),
+                entry.get("packed"),
+            )
+        return self._series.first()
 
     # Method to clear all the variable names
     def _clear(self):
@@ -304,18 +1496,28 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
         self._surface_vars.clear()
         self._interface_vars.clear()
         self._midpoint_vars.clear()
+        self._other_vars.clear()
+        self._dim_sizes.clear()
         # Clear special variable cache when metadata changes
         self._cached_lev = None
         self._cached_ilev = None
         self._cached_area = None
+        self._cached_hybrid.clear()
+        self._psvar = None
 
     def _clear_geometry_cache(self):
         """Clear cached geometry data."""
+        self._clear_output_geometry()
+        self._crop_geometry.clear()
+        self._cached_ncells2D = None
+        self._geometry_arrays = None
+        self._cached_cell_bounds = None
+
+    def _clear_output_geometry(self):
+        """Clear the VTK geometry of the output, keeping the mesh arrays."""
         self._cached_points = None
-        self._cached_cells = None
         self._cached_cell_types = None
-        self._cached_offsets = None
-        self._cached_ncells2D = None
+        self._cached_cell_array = None
 
     def _get_cached_lev(self, vardata):
         """Get cached lev array or compute and cache it."""
@@ -333,39 +1535,542 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
             )
         return self._cached_ilev
 
+    def _get_dimension_indices(self, varmeta):
+        """Indices of the slice of a variable along its extra dimensions."""
+        return tuple(
+            min(max(0, self._dim_indices.get(d, 0)), self._dim_sizes.get(d, 1) - 1)
+            for d in varmeta.extra_dims
+        )
+
+    def _get_cached_hybrid(self, vardata, varmeta):
+        """Get the cached hybrid coefficients of the layers of a 3D variable."""
+        if varmeta.type == VarType._3Di:
+            hya, hyb = EAMConstants.HYAI, EAMConstants.HYBI
+        else:
+            hya, hyb = EAMConstants.HYAM, EAMConstants.HYBM
+        if hya not in self._cached_hybrid:
+            self._cached_hybrid[hya] = FindHybridCoefficients(vardata, hya, hyb)
+        return self._cached_hybrid[hya]
+
+    def _get_vertical_level(self, vardata, varmeta, levInd):
+        """Level key of the 3D slices, a pressure level when enabled."""
+        if self._pressure_level <= 0:
+            return levInd
+        if self._psvar is None or self._get_cached_hybrid(vardata, varmeta) is None:
+            print_error(
+                "Pressure levels need the PS variable and hybrid coefficients, "
+                "slicing model layers instead"
+            )
+            return levInd
+        return PressureLevel(self._pressure_level)
+
     def _get_cached_area(self, vardata):
         """Get cached area array or load and cache it."""
         if self._cached_area is None and self._areavar:
-            data = vardata[self._areavar.name][:].data
+            data = vardata[self._areavar.name][:]
             # Use reshape instead of flatten to avoid copy
-            self._cached_area = data.reshape(-1)
-            # Apply fill value replacement in-place
-            mask = self._cached_area == self._areavar.fillval
-            self._cached_area[mask] = np.nan
+            self._cached_area = self._apply_fillval(data.reshape(-1), self._areavar)
         return self._cached_area
 
+    def _hyperslab_index(self, varmeta, timeInd, levInd=None, columns=None):
+        """
+        Index of the (time), (time, lev) or, for variables with extra
+        dimensions, (time, index per extra dimension) hyperslab of a variable.
+        """
+        # Only request the current time step (and layer) from netCDF4
+        cols = slice(*columns) if columns is not None else slice(None)
+        if varmeta.type == VarType._ND:
+            # One index along each extra dimension, in file dimension order
+            index = dict(zip(varmeta.extra_dims, levInd))
+            index.update(time=timeInd, ncol=cols)
+            return tuple(index[d] for d in varmeta.dims)
+        if levInd is None:
+            return (timeInd, cols)
+        if not varmeta.transpose:
+            return (timeInd, levInd, cols)
+        return (timeInd, cols, levInd)
+
+    def _read_hyperslab(self, vardata, varmeta, timeInd, levInd=None, columns=None):
+        """Read a hyperslab of a variable, see _hyperslab_index."""
+        index = self._hyperslab_index(varmeta, timeInd, levInd, columns)
+        return vardata[varmeta.name][index]
+
+    def _apply_fillval(self, data, varmeta):
+        """
+        Replace the fill values of a variable with NaN, in place.
+
+        Floating point data keeps its precision (float32 stays float32) so
+        the buffer can be handed over to VTK as is. Integer data is
+        converted to float64 to hold the NaNs. Views of a memory-mapped
+        file are copied once, in native byte order.
+        """
+        data = np.ma.getdata(data)
+        if not np.issubdtype(data.dtype, np.floating):
+            data = data.astype(np.float64)
+        elif not data.dtype.isnative or not data.flags.writeable:
+            data = data.astype(data.dtype.newbyteorder("="))
+        fillval = data.dtype.type(varmeta.fillval)
+        if not np.isnan(fillval):
+            np.putmask(data, data == fillval, np.nan)
+        return data
+
     def _load_2d_variable(self, vardata, varmeta, timeInd):
-        """Load 2D variable data with optimized operations."""
-        # Get data without unnecessary copy
-        data = vardata[varmeta.name][:].data[timeInd].flatten()
-        data = np.where(data == varmeta.fillval, np.nan, data)
+        """Load the (time) hyperslab of a 2D variable."""
+        data = self._read_hyperslab(vardata, varmeta, timeInd)
+        return self._apply_fillval(data, varmeta)
+
+    def _load_3d_slice(self, vardata, varmeta, timeInd, levInd):
+        """Load the (time, lev) hyperslab of a 3D variable."""
+        data = self._read_hyperslab(vardata, varmeta, timeInd, levInd)
+        return self._apply_fillval(data, varmeta)
+
+    def _slice_key(self, varmeta, timeInd, levInd=None):
+        """Slice cache key, using the file holding the time step."""
+        path, fileTimeInd = self._series.locate(timeInd)
+        return (path, varmeta.name, fileTimeInd, levInd, self._columns)
+
+    def _load_slice(self, key, varmeta):
+        """Load a 2D variable or a layer of a 3D variable."""
+        path, _, fileTimeInd, levInd, columns = key
+        if isinstance(levInd, PressureLevel):
+            return self._load_pressure_slice(key, varmeta)
+        if self._get_io_workers(path) is not None:
+            return self._read_on_workers(path, varmeta, fileTimeInd, levInd, columns)
+        # Hold the lock from open to read so the handle cannot be evicted
+        with self._netcdf_lock:
+            vardata = self._series.open(path)
+            data = self._read_hyperslab(vardata, varmeta, fileTimeInd, levInd, columns)
+        # Fill value handling runs outside the lock, in parallel
+        return self._apply_fillval(data, varmeta)
+
+    def _load_pressure_slice(self, key, varmeta):
+        """
+        Interpolate a 3D variable to a pressure level. The column stack of
+        the time step is read at once and all the columns are interpolated
+        together.
+        """
+        path, _, fileTimeInd, level, columns = key
+        with self._netcdf_lock:
+            vardata = self._series.open(path)
+            hya, hyb = self._get_cached_hybrid(vardata, varmeta)
+            ps = self._read_hyperslab(vardata, self._psvar, fileTimeInd, None, columns)
+        stack = self._get_cached_block(path, varmeta, fileTimeInd, columns)
+        ps = self._apply_fillval(ps, self._psvar)
+        pressure = hya[:, np.newaxis] + hyb[:, np.newaxis] * ps
+        return interpolate_to_pressure(stack, pressure, level.hPa * 100.0)
+
+    def _has_slice(self, key):
+        """Whether a slice is cached, or can be cut out of a cached one."""
+        columns = key[-1]
+        return key in self._slice_cache or (
+            columns is not None and key[:-1] + (None,) in self._slice_cache
+        )
+
+    def _lookup_slice(self, key):
+        """
+        Get a slice from the cache, None when missing. The column range of a
+        cropped slice is cut out of the slice of the whole grid when that one
+        is cached, so that cropping does not read the data again.
+        """
+        columns = key[-1]
+        if columns is not None and key not in self._slice_cache:
+            whole = key[:-1] + (None,)
+            if whole in self._slice_cache:
+                data = self._slice_cache.get(whole)
+                if data is not None:
+                    return data[..., columns[0] : columns[1]]
+        return self._slice_cache.get(key)
+
+    def _get_cached_slice(self, varmeta, timeInd, levInd=None):
+        """Get cached slice or load and cache it."""
+        key = self._slice_key(varmeta, timeInd, levInd)
+        data = self._get_block_layer(key, varmeta)
+        if data is not None:
+            return data
+        data = self._lookup_slice(key)
+        if data is None:
+            data = self._load_slice(key, varmeta)
+            self._slice_cache.put(key, data)
         return data
 
-    def _load_3d_slice(self, vardata, varmeta, timeInd, start_idx, end_idx):
-        """Load a slice of 3D variable data with optimized operations."""
-        # Load full 3D data for time step
-        if not varmeta.transpose:
-            data = vardata[varmeta.name][:].data[timeInd].flatten()[start_idx:end_idx]
+    def _is_current_time(self, path, fileTimeInd):
+        return (path, fileTimeInd) == self._series.locate(self._time)
+
+    def _read_block(self, path, varmeta, fileTimeInd, columns):
+        """Read the (lev, ncol) block of a 3D variable at a time step."""
+        if self._get_io_workers(path) is not None:
+            block = self._read_on_workers(
+                path, varmeta, fileTimeInd, slice(None), columns
+            )
         else:
-            data = (
-                vardata[varmeta.name][:]
-                .data[timeInd]
-                .transpose()
-                .flatten()[start_idx:end_idx]
+            with self._netcdf_lock:
+                vardata = self._series.open(path)
+                block = self._read_hyperslab(
+                    vardata, varmeta, fileTimeInd, slice(None), columns
+                )
+            block = self._apply_fillval(block, varmeta)
+        if varmeta.transpose:
+            # Layer major, so that every layer is a contiguous view
+            block = np.ascontiguousarray(block.transpose())
+        return block
+
+    def _block_key(self, key):
+        """Slice cache key of the block holding the layer of a slice key."""
+        path, name, fileTimeInd, _, columns = key
+        return (path, name, fileTimeInd, ALL_LEVELS, columns)
+
+    def _get_cached_block(self, path, varmeta, fileTimeInd, columns):
+        """
+        Get the (lev, ncol) block of a 3D variable, caching the blocks of the
+        current time step.
+        """
+        key = (path, varmeta.name, fileTimeInd, ALL_LEVELS, columns)
+        block = self._lookup_slice(key)
+        if block is None:
+            block = self._read_block(path, varmeta, fileTimeInd, columns)
+            if self._is_current_time(path, fileTimeInd):
+                self._slice_cache.put(key, block)
+        return block
+
+    def _get_block_layer(self, key, varmeta):
+        """
+        Serve a layer of the current time step as a view of its block, when
+        the block is cached or the layers are being scrubbed. Returns None
+        for the slices read on their own.
+        """
+        if not self._is_block_layer(key, varmeta):
+            return None
+        path, _, fileTimeInd, levInd, columns = key
+        return self._get_cached_block(path, varmeta, fileTimeInd, columns)[levInd]
+
+    def _is_block_layer(self, key, varmeta):
+        """Whether a slice is served as a layer of its block."""
+        path, _, fileTimeInd, levInd, _ = key
+        if varmeta.type not in (VarType._3Dm, VarType._3Di):
+            return False
+        if isinstance(levInd, PressureLevel):
+            return False
+        if self._has_slice(self._block_key(key)):
+            return True
+        scrubbing = self._level_changed or self._prefetch_track != Track.TIME
+        return scrubbing and self._is_current_time(path, fileTimeInd)
+
+    def _get_io_workers(self, path):
+        """
+        I/O worker processes reading the slices of a data file, None when the
+        file is read in this process: workers are disabled, or the file is
+        memory mapped or holds packed variables.
+        """
+        if self._io_processes <= 0 or SliceWorkers is None or self._series.packed:
+            return None
+        with self._netcdf_lock:
+            if isinstance(self._series.open(path), ClassicFile):
+                return None
+            if self._io_workers is None:
+                self._io_workers = SliceWorkers(
+                    self._io_processes, self._max_open_files
+                )
+            return self._io_workers
+
+    def _slice_request(self, path, varmeta, fileTimeInd, levInd, columns):
+        """Describe a hyperslab for the I/O workers."""
+        with self._netcdf_lock:
+            variable = self._series.open(path)[varmeta.name]
+            shape, dtype = variable.shape, variable.dtype
+        index = self._hyperslab_index(varmeta, fileTimeInd, levInd, columns)
+        return SliceRequest(path, varmeta.name, index, shape, dtype, varmeta.fillval)
+
+    def _read_on_workers(self, path, varmeta, fileTimeInd, levInd, columns):
+        """Read a hyperslab on the I/O workers, fill values already applied."""
+        request = self._slice_request(path, varmeta, fileTimeInd, levInd, columns)
+        data, error = self._io_workers.read([request])[0]
+        if error is not None:
+            raise error
+        return data
+
+    def _load_on_workers(self, items):
+        """
+        Load the missing slices of a list of (slice key, varmeta) all at once
+        on the I/O worker processes, along with the blocks of the layers
+        served from them. The slices of a batch share one shared memory
+        block, so they are cached as a group and evicted together. Returns
+        the (data, error) pairs of the slices loaded, by slice key.
+        """
+        loaded = {}
+        reads = {}
+        layers = []
+        for key, varmeta in items:
+            path, _, fileTimeInd, levInd, columns = key
+            if isinstance(levInd, PressureLevel):
+                continue
+            if key in loaded or self._has_slice(key):
+                continue
+            try:
+                if self._get_io_workers(path) is None:
+                    continue
+                if self._is_block_layer(key, varmeta):
+                    # Layers scrubbed from a block are read with the whole block
+                    blockKey = self._block_key(key)
+                    layers.append((key, blockKey, levInd))
+                    if blockKey in loaded or blockKey in reads:
+                        continue
+                    if self._has_slice(blockKey):
+                        loaded[blockKey] = (self._lookup_slice(blockKey), None)
+                        continue
+                    key, levInd = blockKey, slice(None)
+                request = self._slice_request(
+                    path, varmeta, fileTimeInd, levInd, columns
+                )
+            except Exception as e:
+                loaded[key] = (None, e)
+                continue
+            reads[key] = (varmeta, request)
+
+        if reads:
+            try:
+                results = self._io_workers.read([r for _, r in reads.values()])
+            except Exception as e:
+                results = [(None, e)] * len(reads)
+            batch = next(self._worker_batches)
+            for (key, (varmeta, _)), (data, error) in zip(reads.items(), results):
+                if error is None:
+                    if key[3] == ALL_LEVELS and varmeta.transpose:
+                        # Layer major, so that every layer is a contiguous view
+                        data = np.ascontiguousarray(data.transpose())
+                    self._slice_cache.put(key, data, group=batch)
+                loaded[key] = (data, error)
+
+        for key, blockKey, levInd in layers:
+            block, error = loaded[blockKey]
+            loaded[key] = (None if block is None else block[levInd], error)
+        return loaded
+
+    def _get_cached_slices(self, requests, timeInd):
+        """
+        Get the slices of a list of (varmeta, levInd) requests, loading the
+        missing ones on the I/O worker processes, if enabled, or on the
+        worker threads. Results come back in request order as (data, error)
+        pairs.
+        """
+        loaded = {}
+        if self._io_processes > 0 and self._time_reduction == Reduction.NONE:
+            items = []
+            for varmeta, levInd in requests:
+                try:
+                    items.append((self._slice_key(varmeta, timeInd, levInd), varmeta))
+                except Exception:
+                    # Reported when the slice is loaded on its own
+                    continue
+            loaded = self._load_on_workers(items)
+
+        def load(request):
+            varmeta, levInd = request
+            try:
+                if self._time_reduction != Reduction.NONE:
+                    return self._get_reduced_slice(varmeta, levInd), None
+                key = self._slice_key(varmeta, timeInd, levInd)
+                if key in loaded:
+                    return loaded[key]
+                return self._get_cached_slice(varmeta, timeInd, levInd), None
+            except Exception as e:
+                return None, e
+
+        if self._worker_threads <= 1 or len(requests) <= 1:
+            return [load(r) for r in requests]
+
+        if self._load_executor is None:
+            self._load_executor = ThreadPoolExecutor(
+                max_workers=self._worker_threads, thread_name_prefix="EAMLoad"
             )
-        data = np.where(data == varmeta.fillval, np.nan, data)
+        return list(self._load_executor.map(load, requests))
+
+    def _get_reduction_bounds(self):
+        """First and last time step of the reduction, clamped to the series."""
+        last = max(0, len(self._timeSteps) - 1)
+        return sorted(min(max(0, int(i)), last) for i in self._reduction_range)
+
+    def _get_reduced_slice(self, varmeta, levInd=None):
+        """
+        Get the temporal reduction of a slice, streaming through the time
+        steps of the reduction range one at a time.
+        """
+        start, stop = self._get_reduction_bounds()
+        key = (
+            self._DataFileName,
+            varmeta.name,
+            (self._time_reduction, start, stop),
+            levInd,
+            self._columns,
+        )
+        data = self._lookup_slice(key)
+        if data is None:
+            statistics = RunningStatistics()
+            for timeInd in range(start, stop + 1):
+                # Use the cached slices, without filling the cache with the range
+                sliceKey = self._slice_key(varmeta, timeInd, levInd)
+                step = self._lookup_slice(sliceKey)
+                if step is None:
+                    step = self._load_slice(sliceKey, varmeta)
+                statistics.add(step)
+            data = statistics.result(self._time_reduction)
+            self._slice_cache.put(key, data)
         return data
 
+    def _cancel_prefetch(self):
+        """
+        Invalidate queued prefetch work and wait for the in-flight read, a
+        single slice or a batch of at most PREFETCH_BATCH slices.
+        """
+        with self._io_lock:
+            self._prefetch_generation += 1
+
+    def _schedule_prefetch(self):
+        """Queue the slices following the current one along the prefetch track."""
+        if self._prefetch_depth <= 0 or self._time_reduction != Reduction.NONE:
+            return
+
+        surface = self._get_enabled_arrays(self._surface_vars, self._surface_selection)
+        midpoint = self._get_enabled_arrays(
+            self._midpoint_vars, self._midpoint_selection
+        )
+        interface = self._get_enabled_arrays(
+            self._interface_vars, self._interface_selection
+        )
+        other = self._get_enabled_arrays(self._other_vars, self._other_selection)
+        nlev = len(self._cached_lev) if self._cached_lev is not None else 0
+        nilev = len(self._cached_ilev) if self._cached_ilev is not None else 0
+        levels = (self._lev, self._ilev)
+        if self._pressure_level > 0:
+            # Layer tracks do not move the pressure level
+            nlev = nilev = 0
+            levels = (PressureLevel(self._pressure_level),) * 2
+
+        steps = []
+        for step in range(1, self._prefetch_depth + 1):
+            offset = step * self._prefetch_direction
+            requests = []
+            steps.append(requests)
+            if self._prefetch_track == Track.TIME:
+                timeInd = self._time + offset
+                if not 0 <= timeInd < len(self._timeSteps):
+                    break
+                requests.extend((v, timeInd, None) for v in surface)
+                requests.extend((v, timeInd, levels[0]) for v in midpoint)
+                requests.extend((v, timeInd, levels[1]) for v in interface)
+                requests.extend(
+                    (v, timeInd, self._get_dimension_indices(v)) for v in other
+                )
+            elif self._prefetch_track == Track.MIDPOINT:
+                lev = self._lev + offset
+                if not 0 <= lev < nlev:
+                    break
+                requests.extend((v, self._time, lev) for v in midpoint)
+            elif self._prefetch_track == Track.INTERFACE:
+                ilev = self._ilev + offset
+                if not 0 <= ilev < nilev:
+                    break
+                requests.extend((v, self._time, ilev) for v in interface)
+
+        steps = [[(self._slice_key(*r), r[0]) for r in step] for step in steps if step]
+        if not steps:
+            return
+
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="EAMPrefetch"
+            )
+        self._prefetch_executor.submit(self._prefetch, self._prefetch_generation, steps)
+
+    def _prefetch(self, generation, steps):
+        """
+        Load queued slices into the slice cache (runs on the I/O thread). The
+        slices of a step are read in batches on the I/O workers, if enabled,
+        else one at a time. The I/O lock is only held for one read, so that
+        RequestData does not wait for the rest of the step.
+        """
+        for step in steps:
+            loaded = {}
+            if self._io_processes > 0:
+                for start in range(0, len(step), PREFETCH_BATCH):
+                    with self._io_lock:
+                        if generation != self._prefetch_generation:
+                            return
+                        batch = step[start : start + PREFETCH_BATCH]
+                        loaded.update(self._load_on_workers(batch))
+            for key, varmeta in step:
+                if key in loaded:
+                    continue
+                with self._io_lock:
+                    if generation != self._prefetch_generation:
+                        return
+                    if self._has_slice(key) or self._has_slice(self._block_key(key)):
+                        continue
+                    try:
+                        data = self._load_slice(key, varmeta)
+                    except Exception:
+                        # Let RequestData report the error if the slice is needed
+                        return
+                    self._slice_cache.put(key, data)
+
+    def GetCacheStatistics(self):
+        """Return hit/miss counts and resident size of the slice cache."""
+        return self._slice_cache.statistics()
+
+    def RefreshTimeSteps(self):
+        """
+        Append the time steps written to the data file(s) since they were
+        opened, to monitor a running simulation. The geometry, the variable
+        selections and the cached slices are kept. Returns whether new time
+        steps were found.
+        """
+        if self._series is None:
+            return False
+        try:
+            if not self._series.changed(self._DataFileName):
+                return False
+        except OSError as e:
+            print_error("Unable to refresh the time steps :", e)
+            return False
+        # Only stop the prefetch when the files did grow
+        self._cancel_prefetch()
+        with self._io_lock, self._netcdf_lock:
+            try:
+                grown = self._series.refresh(self._DataFileName)
+            except (OSError, RuntimeError, KeyError) as e:
+                # The writer may be in the middle of a record, retry later
+                print_error("Unable to refresh the time steps :", e)
+                return False
+        if not grown:
+            return False
+
+        if self._io_workers is not None:
+            # Open handles do not see the new records
+            self._io_workers.invalidate()
+        # The cataloged time axis is now stale
+        self._catalog_entry = None
+        self._timeSteps.clear()
+        self._timeSteps.extend(self._series.times)
+        self.Modified()
+        return True
+
+    def _select_cells(self, data, columns=True):
+        """
+        Keep the values of the selected cells. ``data`` holds either the
+        column range read from the file or, with ``columns=False``, all the
+        cells of the grid.
+        """
+        if not columns:
+            return data if self._file_ids is None else data[self._file_ids]
+        if self._column_index is None:
+            return data
+        return data[self._column_index]
+
+    def _add_cell_array(self, output_mesh, data, name):
+        """Add a cell array sharing the numpy buffer (no deep copy)."""
+        array = numpy_support.numpy_to_vtk(np.ascontiguousarray(data), deep=False)
+        array.SetName(name)
+        output_mesh.VTKObject.GetCellData().AddArray(array)
+
     def _get_enabled_arrays(self, var_list, selection_obj):
         """Get list of enabled variable names from selection object."""
         enabled = []
@@ -374,12 +2079,170 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
                 enabled.append(varmeta)
         return enabled
 
-    def _build_geometry(self, meshdata):
-        """Build and cache geometry data from mesh dataset."""
+    def _build_geometry(self):
+        """Build and cache geometry data, reusing the on-disk cache if any."""
         if self._cached_points is not None:
             # Geometry already cached
             return
 
+        if self._geometry_arrays is None:
+            self._geometry_arrays = self._load_geometry_arrays()
+            self._cached_ncells2D = len(self._geometry_arrays["cell_types"])
+
+        # The same VTK objects are output for a box seen before, so that
+        # the filters downstream find their own results for it in cache
+        box = (tuple(self._longitude_range), tuple(self._latitude_range))
+        entry = self._crop_geometry.pop(box, None)
+        if entry is None:
+            entry = self._compute_output_geometry()
+        self._crop_geometry[box] = entry
+        while len(self._crop_geometry) > self._max_crop_boxes:
+            self._crop_geometry.popitem(last=False)
+
+        self._cell_ids = entry.cell_ids
+        self._file_ids = entry.file_ids
+        self._columns = entry.columns
+        self._column_index = entry.column_index
+        self._cached_points = entry.points
+        self._cached_cell_types = entry.cell_types
+        self._cached_cell_array = entry.cell_array
+
+    def _compute_output_geometry(self):
+        """Select the cells of the crop box and build their VTK geometry."""
+        self._update_cell_selection()
+        arrays = self._geometry_arrays
+        if self._cell_ids is not None:
+            arrays = self._subset_geometry(arrays, self._cell_ids)
+
+        # Create VTK points
+        vtk_coords = vtkPoints()
+        vtk_coords.SetData(numpy_support.numpy_to_vtk(arrays["points"], deep=False))
+
+        # Build cell arrays
+        cell_types = numpy_support.numpy_to_vtk(
+            num_array=arrays["cell_types"],
+            deep=False,
+            array_type=vtkConstants.VTK_UNSIGNED_CHAR,
+        )
+        offsets = numpy_support.numpy_to_vtk(
+            num_array=arrays["offsets"],
+            deep=False,
+            array_type=vtkConstants.VTK_ID_TYPE,
+        )
+        cells = numpy_support.numpy_to_vtk(
+            num_array=arrays["connectivity"],
+            deep=False,
+            array_type=vtkConstants.VTK_ID_TYPE,
+        )
+        cell_array = vtkCellArray()
+        cell_array.SetData(offsets, cells)
+
+        return SimpleNamespace(
+            cell_ids=self._cell_ids,
+            file_ids=self._file_ids,
+            columns=self._columns,
+            column_index=self._column_index,
+            points=vtk_coords,
+            cell_types=cell_types,
+            cell_array=cell_array,
+        )
+
+    def _load_geometry_arrays(self):
+        """Get the mesh arrays from the on-disk cache or compute them."""
+        variant = "-".join(
+            name
+            for name, enabled in (
+                ("merged", self._merge_points),
+                ("hilbert", self._reorder_cells),
+            )
+            if enabled
+        )
+        variant = variant or None
+        arrays = None
+        if self._geometry_cache is not None:
+            arrays = self._geometry_cache.load(self._ConnFileName, variant)
+        if arrays is None:
+            arrays = self._compute_geometry(self._get_mesh_dataset())
+            if self._reorder_cells:
+                arrays = reorder_cells(arrays, hilbert_order(arrays))
+            if self._geometry_cache is not None:
+                try:
+                    self._geometry_cache.save(self._ConnFileName, arrays, variant)
+                except OSError as e:
+                    print_error("Unable to store the geometry cache :", e)
+        return arrays
+
+    def _get_cell_bounds(self):
+        """Get the per-cell bounding boxes or compute and cache them."""
+        if self._cached_cell_bounds is None:
+            self._cached_cell_bounds = cell_bounds(self._geometry_arrays)
+        return self._cached_cell_bounds
+
+    def _update_cell_selection(self):
+        """
+        Select the cells overlapping the crop box, and the file columns to
+        read for them.
+        """
+        self._cell_ids = None
+        self._file_ids = None
+        self._columns = None
+        self._column_index = None
+
+        self._select_crop_cells()
+        # Reordered cells map to columns in another order
+        order = self._geometry_arrays.get("cell_order")
+        file_ids = self._cell_ids
+        if order is not None:
+            file_ids = order if file_ids is None else order[file_ids]
+        if file_ids is None:
+            return
+
+        self._file_ids = file_ids
+        if len(file_ids) == 0:
+            self._columns = (0, 0)
+            return
+        # Read the smallest column range holding the cells, then pick them
+        start, stop = int(file_ids.min()), int(file_ids.max()) + 1
+        self._columns = (start, stop)
+        if order is not None or stop - start != len(file_ids):
+            self._column_index = file_ids - start
+
+    def _select_crop_cells(self):
+        """Select the cells overlapping the crop box, None for all of them."""
+        lon0, lon1 = self._longitude_range
+        lat0, lat1 = self._latitude_range
+        if lon0 <= -180.0 and lon1 >= 180.0 and lat0 <= -90.0 and lat1 >= 90.0:
+            return
+
+        bounds = self._get_cell_bounds()
+        west, east, south, north = bounds.T
+        # Downstream, the part of a cell east of 180 is moved by -360, so a
+        # cell may overlap the box through either of its two parts
+        inside = (west <= 180.0) & (west <= lon1) & (np.minimum(east, 180.0) >= lon0)
+        inside |= (
+            (east >= 180.0)
+            & (np.maximum(west, 180.0) - 360.0 <= lon1)
+            & (east - 360.0 >= lon0)
+        )
+        inside &= (south <= lat1) & (north >= lat0)
+
+        cell_ids = np.flatnonzero(inside)
+        if len(cell_ids) != len(bounds):
+            self._cell_ids = cell_ids
+
+    def _subset_geometry(self, arrays, cell_ids):
+        """Mesh arrays restricted to the given cells and the points they use."""
+        cells = arrays["connectivity"].reshape(-1, 4)[cell_ids]
+        used, cells = np.unique(cells, return_inverse=True)
+        return {
+            "points": arrays["points"][used],
+            "offsets": np.arange(0, (4 * len(cell_ids)) + 1, 4, dtype=np.int64),
+            "connectivity": cells.reshape(-1).astype(np.int64),
+            "cell_types": arrays["cell_types"][cell_ids],
+        }
+
+    def _compute_geometry(self, meshdata):
+        """Compute the mesh arrays from the connectivity dataset."""
         dims = meshdata.dimensions
         mdims = np.array(list(meshdata.dimensions.keys()))
         mvars = np.array(list(meshdata.variables.keys()))
@@ -393,68 +2256,91 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
                 )[0][0]
             ]
         ].size
-        self._cached_ncells2D = ncells2D
 
         # Find lat/lon dimensions
         latdim = mvars[np.where(np.char.find(mvars, "corner_lat") > -1)][0]
         londim = mvars[np.where(np.char.find(mvars, "corner_lon") > -1)][0]
 
         # Build coordinates
-        lat = meshdata[latdim][:].data.flatten()
-        lon = meshdata[londim][:].data.flatten()
+        lat = np.ma.getdata(meshdata[latdim][:]).flatten()
+        lon = np.ma.getdata(meshdata[londim][:]).flatten()
 
         coords = np.empty((len(lat), 3), dtype=np.float64)
         coords[:, 0] = lon
         coords[:, 1] = lat
         coords[:, 2] = 0.0
 
-        # Create VTK points
-        _coords = dsa.numpyTovtkDataArray(coords)
-        vtk_coords = vtkPoints()
-        vtk_coords.SetData(_coords)
-        self._cached_points = vtk_coords
+        if self._merge_points:
+            coords, cells = merge_coincident_points(coords)
+        else:
+            cells = np.arange(ncells2D * 4, dtype=np.int64)
 
-        # Build cell arrays
         cellTypes = np.empty(ncells2D, dtype=np.uint8)
         cellTypes.fill(vtkConstants.VTK_QUAD)
-        self._cached_cell_types = numpy_support.numpy_to_vtk(
-            num_array=cellTypes.ravel(),
-            deep=True,
-            array_type=vtkConstants.VTK_UNSIGNED_CHAR,
-        )
 
-        offsets = np.arange(0, (4 * ncells2D) + 1, 4, dtype=np.int64)
-        self._cached_offsets = numpy_support.numpy_to_vtk(
-            num_array=offsets.ravel(),
-            deep=True,
-            array_type=vtkConstants.VTK_ID_TYPE,
-        )
+        return {
+            "points": coords,
+            "offsets": np.arange(0, (4 * ncells2D) + 1, 4, dtype=np.int64),
+            "connectivity": cells,
+            "cell_types": cellTypes,
+        }
 
-        cells = np.arange(ncells2D * 4, dtype=np.int64)
-        self._cached_cells = numpy_support.numpy_to_vtk(
-            num_array=cells.ravel(), deep=True, array_type=vtkConstants.VTK_ID_TYPE
-        )
+    def _read_variable_metadata(self, vardata):
+        """Walk the header for the (name, dimensions, fill value) of the variables."""
+        variables = []
+        for name, info in vardata.variables.items():
+            dims = set(info.dimensions)
+            # ncol only, or time and ncol with any other dimensions
+            if not (dims == dims1 or dims >= dims2):
+                continue
+            fillval = None
+            try:
+                fillval = info.getncattr("_FillValue")
+            except Exception:
+                try:
+                    fillval = info.getncattr("missing_value")
+                except Exception:
+                    pass
+            if fillval is not None:
+                fillval = float(fillval)
+            variables.append((name, list(info.dimensions), fillval))
+        return variables
 
     def _populate_variable_metadata(self):
         if self._DataFileName is None:
             return
-        vardata = self._get_var_dataset()
+        self._metadata_dirty = False
 
         # Clear existing selection arrays BEFORE adding new ones
         self._surface_selection.RemoveAllArrays()
         self._midpoint_selection.RemoveAllArrays()
         self._interface_selection.RemoveAllArrays()
+        self._other_selection.RemoveAllArrays()
+        self._other_vars.clear()
+        self._dim_sizes.clear()
 
-        for name, info in vardata.variables.items():
-            dims = set(info.dimensions)
-            if not (dims == dims1 or dims == dims2 or dims == dims3m or dims == dims3i):
-                continue
-            varmeta = VarMeta(name, info)
+        paths = FileSeries.expand(self._DataFileName)
+        entry = None
+        if self._metadata_catalog is not None:
+            entry = self._metadata_catalog.load(paths)
+        self._catalog_entry = entry
+
+        vardata = self._get_var_dataset()
+        if entry is None:
+            variables = self._read_variable_metadata(vardata)
+        else:
+            variables = entry["variables"]
+
+        for name, dims, fillval in variables:
+            # VarMeta only needs the dimensions of the variable
+            varmeta = VarMeta(name, SimpleNamespace(dimensions=tuple(dims)))
             if varmeta.type == VarType._1D:
                 self._info_vars.append(varmeta)
                 if "area" in name:
                     self._areavar = varmeta
             elif varmeta.type == VarType._2D:
+                if name == "PS":
+                    self._psvar = varmeta
                 self._surface_vars.append(varmeta)
                 self._surface_selection.AddArray(name)
             elif varmeta.type == VarType._3Dm:
@@ -463,45 +2349,78 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
             elif varmeta.type == VarType._3Di:
                 self._interface_vars.append(varmeta)
                 self._interface_selection.AddArray(name)
-            try:
-                fillval = info.getncattr("_FillValue")
+            elif varmeta.type == VarType._ND:
+                self._other_vars.append(varmeta)
+                self._other_selection.AddArray(name)
+            if fillval is not None:
                 varmeta.fillval = fillval
-            except Exception:
-                try:
-                    fillval = info.getncattr("missing_value")
-                    varmeta.fillval = fillval
-                except Exception:
-                    pass
         self._surface_selection.DisableAllArrays()
         self._interface_selection.DisableAllArrays()
         self._midpoint_selection.DisableAllArrays()
+        self._other_selection.DisableAllArrays()
+
+        if entry is not None:
+            self._dim_sizes.update(entry["dimensions"])
+        else:
+            for varmeta in self._other_vars:
+                for dim in varmeta.extra_dims:
+                    self._dim_sizes[dim] = vardata.dimensions[dim].size
 
         # Clear old timestamps before adding new ones
         self._timeSteps.clear()
-        timesteps = vardata["time"][:].data.flatten()
-        self._timeSteps.extend(timesteps)
+        self._timeSteps.extend(self._series.times)
+
+        if entry is not None:
+            for key in ("lev", "ilev"):
+                if entry[key] is not None:
+                    setattr(self, f"_cached_{key}", np.asarray(entry[key]))
+        elif self._metadata_catalog is not None:
+            self._save_catalog(paths, vardata, variables)
+
+    def _save_catalog(self, paths, vardata, variables):
+        """Store the metadata of the data file(s) for the next sessions."""
+        try:
+            lev = self._get_cached_lev(vardata)
+            ilev = self._get_cached_ilev(vardata)
+        except Exception:
+            # Reported by RequestData, do not catalog a broken file
+            return
+        entry = {
+            "variables": variables,
+            "file_times": [t.tolist() for t in self._series.file_times],
+            "packed": self._series.packed,
+            "lev": lev.tolist() if lev is not None else None,
+            "ilev": ilev.tolist() if ilev is not None else None,
+            "dimensions": self._dim_sizes,
+        }
+        try:
+            self._metadata_catalog.save(paths, entry)
+        except OSError as e:
+            print_error("Unable to store the metadata catalog :", e)
 
     def SetDataFileName(self, fname):
         if fname is not None and fname != "None":
             if fname != self._DataFileName:
+                self._cancel_prefetch()
                 self._DataFileName = fname
+                # The dimensions of the new file start at their first index
+                self._dim_indices = {}
                 self._dirty = True
                 self._surface_update = True
                 self._midpoint_update = True
                 self._interface_update = True
                 self._clear()
-                # Close old dataset if filename changed
-                if self._cached_var_filename != fname and self._var_dataset is not None:
-                    try:
-                        self._var_dataset.close()
-                    except Exception:
-                        pass
-                    self._var_dataset = None
-                self._populate_variable_metadata()
+                # Close old dataset(s) if filename changed
+                if self._series is not None:
+                    self._series.close()
+                    self._series = None
+                # Read in RequestInformation, once all properties are set
+                self._metadata_dirty = True
                 self.Modified()
 
     def SetConnFileName(self, fname):
         if fname != self._ConnFileName:
+            self._cancel_prefetch()
             self._ConnFileName = fname
             self._dirty = True
             self._surface_update = True
@@ -518,18 +2437,178 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
             self._clear_geometry_cache()
             self.Modified()
 
+    def SetGeometryCacheDirectory(self, directory):
+        directory = directory or None
+        current = self._geometry_cache.directory if self._geometry_cache else None
+        if directory != current:
+            self._geometry_cache = GeometryCache(directory) if directory else None
+
+    def SetMetadataCacheDirectory(self, directory):
+        directory = directory or None
+        current = self._metadata_catalog.directory if self._metadata_catalog else None
+        if directory != current:
+            self._metadata_catalog = MetadataCatalog(directory) if directory else None
+
+    def SetMergePoints(self, merge):
+        merge = bool(merge)
+        if self._merge_points != merge:
+            self._merge_points = merge
+            self._dirty = True
+            self._clear_geometry_cache()
+            self.Modified()
+
+    def SetReorderCells(self, reorder):
+        reorder = bool(reorder)
+        if self._reorder_cells != reorder:
+            self._cancel_prefetch()
+            self._reorder_cells = reorder
+            # Rebuild the output with the cells, and data, in the new order
+            self._dirty = True
+            self._surface_update = True
+            self._midpoint_update = True
+            self._interface_update = True
+            self._other_update = True
+            self._clear_geometry_cache()
+            self.Modified()
+
+    def _set_crop(self, longitude_range, latitude_range):
+        if (
+            self._longitude_range != longitude_range
+            or self._latitude_range != latitude_range
+        ):
+            self._cancel_prefetch()
+            self._longitude_range = longitude_range
+            self._latitude_range = latitude_range
+            # Rebuild the output with the cells of the new box
+            self._dirty = True
+            self._surface_update = True
+            self._midpoint_update = True
+            self._interface_update = True
+            self._other_update = True
+            self._clear_output_geometry()
+            self.Modified()
+
+    def SetLongitudeRange(self, min, max):
+        self._set_crop([min, max], self._latitude_range)
+
+    def SetLatitudeRange(self, min, max):
+        self._set_crop(self._longitude_range, [min, max])
+
     def SetMiddleLayer(self, lev):
         if self._lev != lev:
             self._lev = lev
+            self._level_changed = True
             self._midpoint_update = True
             self.Modified()
 
     def SetInterfaceLayer(self, ilev):
         if self._ilev != ilev:
             self._ilev = ilev
+            self._level_changed = True
             self._interface_update = True
             self.Modified()
 
+    def _set_reduction(self, reduction, reduction_range):
+        if (
+            self._time_reduction != reduction
+            or self._reduction_range != reduction_range
+        ):
+            self._time_reduction = reduction
+            self._reduction_range = reduction_range
+            self._surface_update = True
+            self._midpoint_update = True
+            self._interface_update = True
+            self._other_update = True
+            self.Modified()
+
+    def SetTimeReduction(self, reduction):
+        self._set_reduction(Reduction(int(reduction)), self._reduction_range)
+
+    def SetTimeReductionRange(self, start, stop):
+        self._set_reduction(self._time_reduction, [int(start), int(stop)])
+
+    def ClearDimensionIndices(self):
+        if self._dim_indices:
+            self._dim_indices = {}
+            self._other_update = True
+            self.Modified()
+
+    def SetDimensionIndex(self, dimension, index):
+        index = int(index)
+        if self._dim_indices.get(dimension, 0) != index:
+            self._dim_indices[dimension] = index
+            self._other_update = True
+            self.Modified()
+
+    def SetPressureLevel(self, pressure):
+        pressure = max(0.0, float(pressure))
+        if self._pressure_level != pressure:
+            self._pressure_level = pressure
+            self._midpoint_update = True
+            self._interface_update = True
+            self.Modified()
+
+    def SetMaxOpenFiles(self, count):
+        self._max_open_files = max(1, int(count))
+        if self._series is not None:
+            # Evicted handles may be in use by the prefetch thread
+            self._cancel_prefetch()
+            with self._io_lock, self._netcdf_lock:
+                self._series.resize(self._max_open_files)
+
+    def _reset_series(self):
+        """Reopen the data files with the selected backends on next access."""
+        self._cancel_prefetch()
+        if self._series is not None:
+            self._series.close()
+            self._series = None
+
+    def SetMemoryMap(self, enabled):
+        enabled = bool(enabled)
+        if self._memory_map != enabled:
+            self._memory_map = enabled
+            self._reset_series()
+
+    def SetParallelDecompression(self, enabled):
+        enabled = bool(enabled)
+        if self._parallel_decompression != enabled:
+            self._parallel_decompression = enabled
+            self._reset_series()
+
+    def SetWorkerThreads(self, count):
+        count = max(1, int(count))
+        if self._worker_threads != count:
+            self._worker_threads = count
+            if self._load_executor is not None:
+                self._load_executor.shutdown(wait=False)
+                self._load_executor = None
+            if self._parallel_decompression:
+                self._reset_series()
+
+    def SetIOProcesses(self, count):
+        count = max(0, int(count))
+        if self._io_processes != count:
+            self._cancel_prefetch()
+            self._io_processes = count
+            if self._io_workers is not None:
+                self._io_workers.close()
+                self._io_workers = None
+
+    def SetCacheSize(self, size):
+        budget = int(size) * 1024 * 1024
+        if self._slice_cache.budget != budget:
+            self._slice_cache.resize(budget)
+
+    def SetPrefetchDepth(self, depth):
+        # Prefetching does not change the output, no need to call Modified()
+        self._prefetch_depth = max(0, int(depth))
+
+    def SetPrefetchTrack(self, track):
+        self._prefetch_track = Track(int(track))
+
+    def SetPrefetchDirection(self, direction):
+        self._prefetch_direction = -1 if direction < 0 else 1
+
     def SetCalculateAverages(self, calcavg):
         if self._avg != calcavg:
             self._avg = calcavg
@@ -558,7 +2637,22 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
     def GetInterfaceVariables(self):
         return self._interface_selection
 
+    @smproperty.dataarrayselection(name="Other Variables")
+    def GetOtherVariables(self):
+        return self._other_selection
+
+    def GetExtraDimensionsInfo(self):
+        info = vtkStringArray()
+        for varmeta in self._other_vars:
+            for dim in varmeta.extra_dims:
+                info.InsertNextValue(varmeta.name)
+                info.InsertNextValue(dim)
+                info.InsertNextValue(str(self._dim_sizes.get(dim, 1)))
+        return info
+
     def RequestInformation(self, request, inInfo, outInfo):
+        if self._metadata_dirty:
+            self._populate_variable_metadata()
         executive = self.GetExecutive()
         port = outInfo.GetInformationObject(0)
         port.Remove(executive.TIME_STEPS())
@@ -570,10 +2664,6 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
             port.Append(executive.TIME_RANGE(), self._timeSteps[-1])
         return 1
 
-    # TODO : implement request extents
-    def RequestUpdateExtent(self, request, inInfo, outInfo):
-        return super().RequestUpdateExtent(request, inInfo, outInfo)
-
     def get_time_index(self, outInfo, executive, from_port):
         timeInfo = outInfo.GetInformationObject(from_port)
         timeInd = 0
@@ -603,21 +2693,25 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
             print_error("Required Python module 'netCDF4' or 'numpy' missing!")
             return 0
 
+        # Wait for the prefetch thread to release the netCDF handles
+        self._cancel_prefetch()
+
         # Getting the correct time index
         executive = self.GetExecutive()
         from_port = request.Get(executive.FROM_OUTPUT_PORT())
         timeInd = self.get_time_index(outInfo, executive, from_port)
         if self._time != timeInd:
             self._time = timeInd
+            self._level_changed = False
             self._surface_update = True
             self._midpoint_update = True
             self._interface_update = True
+            self._other_update = True
 
-        meshdata = self._get_mesh_dataset()
         vardata = self._get_var_dataset()
 
         # Build geometry if not cached
-        self._build_geometry(meshdata)
+        self._build_geometry()
 
         output_mesh = dsa.WrapDataObject(self._output)
 
@@ -628,22 +2722,22 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
             # Use cached geometry
             output_mesh.SetPoints(self._cached_points)
 
-            # Create cell array from cached data
-            cellArray = vtkCellArray()
-            cellArray.SetData(self._cached_offsets, self._cached_cells)
-            output_mesh.VTKObject.SetCells(self._cached_cell_types, cellArray)
+            # Use cached cells
+            output_mesh.VTKObject.SetCells(
+                self._cached_cell_types, self._cached_cell_array
+            )
 
             self._dirty = False
 
-        # Use cached ncells2D
-        ncells2D = self._cached_ncells2D
-
         # Needed to drop arrays from cached VTK Object
         to_remove = set()
         last_num_arrays = output_mesh.CellData.GetNumberOfArrays()
         for i in range(last_num_arrays):
             to_remove.add(output_mesh.CellData.GetArrayName(i))
 
+        # Slices to (re)load as (varmeta, levInd), in output order
+        to_load = []
+
         for varmeta in self._surface_vars:
             if self._surface_selection.ArrayIsEnabled(varmeta.name):
                 if output_mesh.CellData.HasArray(varmeta.name):
@@ -652,8 +2746,7 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
                     not output_mesh.CellData.HasArray(varmeta.name)
                     or self._surface_update
                 ):
-                    data = self._load_2d_variable(vardata, varmeta, timeInd)
-                    output_mesh.CellData.append(data, varmeta.name)
+                    to_load.append((varmeta, None))
         self._surface_update = False
 
         try:
@@ -667,9 +2760,6 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
                     print_error(
                         f"User provided input for middle layer {self._lev} larger than actual data {len(lev) - 1}"
                     )
-                lstart = self._lev * ncells2D
-                lend = lstart + ncells2D
-
                 for varmeta in self._midpoint_vars:
                     if self._midpoint_selection.ArrayIsEnabled(varmeta.name):
                         if output_mesh.CellData.HasArray(varmeta.name):
@@ -678,10 +2768,10 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
                             not output_mesh.CellData.HasArray(varmeta.name)
                             or self._midpoint_update
                         ):
-                            data = self._load_3d_slice(
-                                vardata, varmeta, timeInd, lstart, lend
+                            level = self._get_vertical_level(
+                                vardata, varmeta, self._lev
                             )
-                            output_mesh.CellData.append(data, varmeta.name)
+                            to_load.append((varmeta, level))
             self._midpoint_update = False
         except Exception as e:
             print_error("Error occurred while processing middle layer variables :", e)
@@ -698,8 +2788,6 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
                     print_error(
                         f"User provided input for middle layer {self._ilev} larger than actual data {len(ilev) - 1}"
                     )
-                ilstart = self._ilev * ncells2D
-                ilend = ilstart + ncells2D
                 for varmeta in self._interface_vars:
                     if self._interface_selection.ArrayIsEnabled(varmeta.name):
                         if output_mesh.CellData.HasArray(varmeta.name):
@@ -708,10 +2796,10 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
                             not output_mesh.CellData.HasArray(varmeta.name)
                             or self._interface_update
                         ):
-                            data = self._load_3d_slice(
-                                vardata, varmeta, timeInd, ilstart, ilend
+                            level = self._get_vertical_level(
+                                vardata, varmeta, self._ilev
                             )
-                            output_mesh.CellData.append(data, varmeta.name)
+                            to_load.append((varmeta, level))
             self._interface_update = False
         except Exception as e:
             print_error(
@@ -719,11 +2807,30 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
             )
             traceback.print_exc()
 
+        for varmeta in self._other_vars:
+            if self._other_selection.ArrayIsEnabled(varmeta.name):
+                if output_mesh.CellData.HasArray(varmeta.name):
+                    to_remove.remove(varmeta.name)
+                if (
+                    not output_mesh.CellData.HasArray(varmeta.name)
+                    or self._other_update
+                ):
+                    to_load.append((varmeta, self._get_dimension_indices(varmeta)))
+        self._other_update = False
+
+        results = self._get_cached_slices(to_load, timeInd)
+        for (varmeta, _), (data, error) in zip(to_load, results):
+            if error is not None:
+                print_error(f"Error occurred while loading {varmeta.name} :", error)
+                continue
+            self._add_cell_array(output_mesh, self._select_cells(data), varmeta.name)
+
         area_var_name = "area"
         if self._areavar and not output_mesh.CellData.HasArray(area_var_name):
             data = self._get_cached_area(vardata)
             if data is not None:
-                output_mesh.CellData.append(data, area_var_name)
+                data = self._select_cells(data, columns=False)
+                self._add_cell_array(output_mesh, data, area_var_name)
         if area_var_name in to_remove:
             to_remove.remove(area_var_name)
 
@@ -733,4 +2840,6 @@ class EAMSliceSource(VTKPythonAlgorithmBase):
         output = vtkUnstructuredGrid.GetData(outInfo, 0)
         output.ShallowCopy(self._output)
 
+        self._schedule_prefetch()
+
         return 1
@@ -23,7 +23,60 @@ def configure_and_parse(parser):
         "-wd",
         "--workdir",
         default=str(Path.cwd().resolve()),
-        help="working directory (to store session data)",
+        help="working directory (to store session data and caches)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        dest="cache_size",
+        type=int,
+        default=1024,
+        help="memory budget in MB for recently loaded data slices",
+    )
+    parser.add_argument(
+        "--prefetch-depth",
+        dest="prefetch_depth",
+        type=int,
+        default=4,
+        help="number of upcoming slices to load in the background (0 to disable)",
+    )
+    parser.add_argument(
+        "--worker-threads",
+        dest="worker_threads",
+        type=int,
+        default=4,
+        help="number of threads used to load the selected variables",
+    )
+    parser.add_argument(
+        "--io-processes",
+        dest="io_processes",
+        type=int,
+        default=0,
+        help="number of processes reading netCDF4/HDF5 data slices in parallel (0 to disable)",
+    )
+    parser.add_argument(
+        "--merge-points",
+        dest="merge_points",
+        action="store_true",
+        help="merge the coincident vertices of the grid cells to save memory",
+    )
+    parser.add_argument(
+        "--reorder-cells",
+        dest="reorder_cells",
+        action="store_true",
+        help="sort the grid cells along a Hilbert curve for memory locality",
+    )
+    parser.add_argument(
+        "--index-statistics",
+        dest="index_statistics",
+        action="store_true",
+        help="index the statistics of every data slice in the background for color ranges and averages",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        dest="poll_interval",
+        type=float,
+        default=5.0,
+        help="seconds between checks for time steps appended to the data file (0 to disable)",
     )
     parser.add_argument(
         "--user-home",
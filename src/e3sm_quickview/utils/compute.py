@@ -33,8 +33,18 @@ def calculate_weighted_average(
         return float(np.mean(data))
 
 
-def extract_avgs(pv_data, array_names):
+def extract_avgs(pv_data, array_names, statistics=None):
     results = {}
+    # Answer from the slice statistics index when available
+    if statistics is not None:
+        for name in array_names:
+            stats = statistics(name)
+            if stats is not None:
+                results[name] = stats["area_mean"]
+    array_names = [name for name in array_names if name not in results]
+    if not array_names:
+        return results
+
     vtk_data = servermanager.Fetch(pv_data)
     area_array = vtk_data.GetCellData().GetArray("area")
     for name in array_names:
@@ -9,6 +9,16 @@ TRACK_STEPS = {
     "midpoints": "midpoint_idx",
 }
 
+PRESSURE_LEVELS = [
+    {"title": "Model layers", "value": 0},
+    *(
+        {"title": f"{p} hPa", "value": p}
+        for p in (1000, 925, 850, 700, 600, 500, 400, 300, 250, 200, 150, 100, 50, 10)
+    ),
+]
+
+TIME_REDUCTIONS = ["None", "Mean", "Minimum", "Maximum", "Standard Deviation"]
+
 TRACK_ENTRIES = {
     "timestamps": {"title": "Time", "value": "timestamps"},
     "midpoints": {"title": "Layer Midpoints", "value": "midpoints"},
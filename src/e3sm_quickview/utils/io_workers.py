@@ -0,0 +1,237 @@
+"""
+Process-based I/O workers for the EAM reader.
+
+The netCDF and HDF5 libraries serialize every call on a global lock, so the
+threads of one process do not read in parallel. The processes of a
+:class:`SliceWorkers` pool open the data files on their own and decode the
+requested slices straight into a shared memory block, which the reader then
+wraps as numpy arrays without copying.
+"""
+
+import multiprocessing
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import netCDF4
+import numpy as np
+
+# Hyperslab ``index`` of variable ``name`` in the file ``path``, along with the
+# full ``shape`` and ``dtype`` of the variable and its fill value
+SliceRequest = namedtuple(
+    "SliceRequest", ["path", "name", "index", "shape", "dtype", "fillval"]
+)
+
+# Alignment (in bytes) of the slices within a shared memory block
+ALIGNMENT = 64
+
+# Datasets opened by a worker process { path : (generation, dataset) }
+_datasets = OrderedDict()
+_max_open = 16
+
+# Shared memory blocks mapped by the reader process, with weak references to
+# the arrays wrapping them. Blocks are closed once all their arrays are gone.
+_blocks = []
+_blocks_lock = threading.Lock()
+
+
+def output_dtype(dtype: np.dtype) -> np.dtype:
+    """
+    Data type of a decoded slice, as produced by the reader: floating point
+    data keeps its precision, in native byte order, and integer data becomes
+    float64 to hold NaN.
+    """
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.floating):
+        return dtype.newbyteorder("=")
+    return np.dtype(np.float64)
+
+
+def hyperslab_shape(shape: Tuple[int, ...], index: tuple) -> Tuple[int, ...]:
+    """
+    Shape of a hyperslab of a variable.
+
+    Args:
+        shape: Shape of the variable
+        index: One integer or slice per dimension
+
+    Returns:
+        Shape of the data read, integer indices dropping their dimension
+    """
+    return tuple(
+        len(range(*k.indices(size)))
+        for k, size in zip(index, shape)
+        if isinstance(k, slice)
+    )
+
+
+def _init_worker(max_open: int) -> None:
+    global _max_open
+    _max_open = max_open
+
+
+def _open(path: str, generation: int):
+    """Get a dataset of the worker, reopened when the reader asks for it."""
+    entry = _datasets.pop(path, None)
+    if entry is not None and entry[0] != generation:
+        entry[1].close()
+        entry = None
+    if entry is None:
+        dataset = netCDF4.Dataset(path, "r")
+        dataset.set_auto_mask(False)
+        entry = (generation, dataset)
+    _datasets[path] = entry
+    while len(_datasets) > _max_open:
+        _, (_, evicted) = _datasets.popitem(last=False)
+        evicted.close()
+    return entry[1]
+
+
+def read_slice(
+    request: SliceRequest,
+    block_name: str,
+    offset: int,
+    generation: int,
+) -> None:
+    """
+    Read a hyperslab into a shared memory block (runs in a worker process).
+
+    Fill values are replaced with NaN, as done by the reader.
+
+    Args:
+        request: Slice to read
+        block_name: Name of the shared memory block
+        offset: Position of the slice within the block
+        generation: Handles opened for an older generation are reopened
+    """
+    data = _open(request.path, generation)[request.name][request.index]
+    shape = hyperslab_shape(request.shape, request.index)
+    dtype = output_dtype(request.dtype)
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        out = np.ndarray(shape, dtype, buffer=block.buf, offset=offset)
+        out[...] = np.ma.getdata(data)
+        fillval = dtype.type(request.fillval)
+        if not np.isnan(fillval):
+            np.putmask(out, out == fillval, np.nan)
+        del out
+    finally:
+        block.close()
+
+
+class _SharedBlock(shared_memory.SharedMemory):
+    def __del__(self):
+        try:
+            self.close()
+        except (OSError, BufferError):
+            # Still wrapped by arrays, e.g. at exit, the mapping goes with them
+            pass
+
+
+def release_blocks() -> None:
+    """Close the shared memory blocks whose arrays were all released."""
+    with _blocks_lock:
+        alive = []
+        for block, arrays in _blocks:
+            if any(array() is not None for array in arrays):
+                alive.append((block, arrays))
+                continue
+            try:
+                block.close()
+            except BufferError:
+                # Still exported by a buffer about to be released
+                alive.append((block, arrays))
+        _blocks[:] = alive
+
+
+class SliceWorkers:
+    """
+    Pool of processes reading slices of the data files into shared memory.
+
+    Every worker keeps its own bounded pool of open datasets. A batch of
+    slices is read into a single shared memory block, so that the reader
+    process only maps one block per batch, and the block is unmapped once
+    none of its slices is referenced anymore. A mapped block keeps a file
+    descriptor open, so a single slice is copied out of its block, which
+    is unmapped right away.
+    """
+
+    def __init__(self, processes: int, max_open: int = 16):
+        # Spawned workers do not inherit the state of the netCDF library
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(max_open,),
+        )
+        self._generation = 0
+
+    def invalidate(self) -> None:
+        """Have the workers reopen their datasets, e.g. after files grew."""
+        self._generation += 1
+
+    def read(
+        self, requests: List[SliceRequest]
+    ) -> List[Tuple[Optional[np.ndarray], Optional[Exception]]]:
+        """
+        Read slices in parallel on the workers.
+
+        Args:
+            requests: Slices to read
+
+        Returns:
+            (data, error) pairs, in request order. The slices of a batch
+            share their shared memory block, a single slice is a copy.
+        """
+        release_blocks()
+        layouts = []
+        size = 0
+        for request in requests:
+            shape = hyperslab_shape(request.shape, request.index)
+            dtype = output_dtype(request.dtype)
+            layouts.append((size, shape, dtype))
+            nbytes = int(np.prod(shape)) * dtype.itemsize
+            size += -(-nbytes // ALIGNMENT) * ALIGNMENT
+
+        block = _SharedBlock(create=True, size=max(size, 1))
+        results = []
+        arrays = []
+        copy = len(requests) == 1
+        try:
+            futures = [
+                self._executor.submit(
+                    read_slice, request, block.name, offset, self._generation
+                )
+                for request, (offset, _, _) in zip(requests, layouts)
+            ]
+            for future, (offset, shape, dtype) in zip(futures, layouts):
+                try:
+                    future.result()
+                except Exception as e:
+                    results.append((None, e))
+                    continue
+                # frombuffer holds the buffer, the block cannot be unmapped
+                # under the array. Views of the slice all refer to it.
+                array = np.frombuffer(block.buf, dtype, int(np.prod(shape)), offset)
+                if copy:
+                    results.append((array.reshape(shape).copy(), None))
+                else:
+                    results.append((array.reshape(shape), None))
+                    arrays.append(weakref.ref(array))
+                del array
+        finally:
+            # The mapping outlives the name, which only the workers needed
+            block.unlink()
+            with _blocks_lock:
+                _blocks.append((block, arrays))
+        if copy:
+            # Nothing refers to the block anymore
+            release_blocks()
+        return results
+
+    def close(self) -> None:
+        """Stop the workers. The slices already read remain valid."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,285 @@
+"""
+Per-slice statistics of EAM data files.
+
+This module builds, in a background process, a compact on-disk index holding
+the min, max, mean, NaN count and area-weighted mean of every
+(variable, time, level) slice of a data file, or group of files. Once built,
+color ranges and field averages are answered from the index instead of
+fetching and scanning the data at every step, and the index is reused by the
+next sessions opening the same files.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import netCDF4
+import numpy as np
+
+VERSION = 1
+STATISTICS = ("min", "max", "mean", "nan_count", "area_mean")
+
+DIMS_2D = {"time", "ncol"}
+DIMS_3D = ({"time", "lev", "ncol"}, {"time", "ilev", "ncol"})
+
+
+def index_key(paths: List[str], fingerprint) -> str:
+    """
+    Identify a group of data files from the fingerprints of its files.
+
+    Args:
+        paths: Data files, in time order
+        fingerprint: Fingerprint of a file, the one of the EAM reader
+
+    Returns:
+        Hex digest changing whenever one of the files is rewritten
+    """
+    digest = hashlib.sha1()
+    for path in paths:
+        # Rewrites are caught by size and mtime, a small sample is enough
+        digest.update(fingerprint(path, sample=64 * 1024).encode())
+    return digest.hexdigest()
+
+
+def _fill_value(variable) -> Optional[float]:
+    for attr in ("_FillValue", "missing_value"):
+        if attr in variable.ncattrs():
+            return float(variable.getncattr(attr))
+    return None
+
+
+def _as_nan(data: np.ndarray, fillval: Optional[float]) -> np.ndarray:
+    data = np.ma.getdata(data).astype(np.float64)
+    if fillval is not None and not np.isnan(fillval):
+        np.putmask(data, data == fillval, np.nan)
+    return data
+
+
+def slice_statistics(
+    data: np.ndarray, area: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Compute the statistics of a block of slices along its last axis.
+
+    Args:
+        data: (..., ncol) values, with NaN for missing values
+        area: Optional (ncol) cell areas for the weighted mean
+
+    Returns:
+        Mapping of each statistic to a (...) array, NaN for empty slices
+    """
+    valid = ~np.isnan(data)
+    count = valid.sum(axis=-1)
+    empty = count == 0
+    zeroed = np.where(valid, data, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        stats = {
+            "min": np.where(valid, data, np.inf).min(axis=-1),
+            "max": np.where(valid, data, -np.inf).max(axis=-1),
+            "mean": zeroed.sum(axis=-1) / count,
+            "nan_count": data.shape[-1] - count,
+        }
+        if area is not None:
+            stats["area_mean"] = (zeroed @ area) / (valid @ area)
+        else:
+            stats["area_mean"] = stats["mean"].copy()
+    for name in ("min", "max", "mean", "area_mean"):
+        stats[name][empty] = np.nan
+    return stats
+
+
+def build_index(paths: List[str], out_path: str) -> str:
+    """
+    Stream once through data files and store the statistics of every slice.
+
+    Each variable is read one time step at a time. The index is a ``.npz``
+    file holding one (time, level) array per variable and statistic, written
+    atomically so that readers never see a partial index.
+
+    Args:
+        paths: Data files, in time order
+        out_path: Location of the index
+
+    Returns:
+        ``out_path``
+    """
+    blocks = {}
+    area = None
+    for path in paths:
+        with netCDF4.Dataset(path, "r") as ds:
+            ds.set_auto_mask(False)
+            for name, variable in ds.variables.items():
+                if "area" in name and set(variable.dimensions) == {"ncol"}:
+                    area = _as_nan(variable[:], _fill_value(variable))
+                    area = np.where(np.isnan(area), 0.0, area)
+                    break
+
+            for name, variable in ds.variables.items():
+                dims = set(variable.dimensions)
+                if dims != DIMS_2D and dims not in DIMS_3D:
+                    continue
+                fillval = _fill_value(variable)
+                transpose = len(dims) == 3 and "ncol" in variable.dimensions[1]
+                file_stats = []
+                for t in range(variable.shape[0]):
+                    data = _as_nan(variable[t], fillval)
+                    if transpose:
+                        data = data.transpose()
+                    # 2D variables are stored as a single level
+                    file_stats.append(slice_statistics(np.atleast_2d(data), area))
+                blocks.setdefault(name, []).extend(file_stats)
+
+    arrays = {"version": np.array(VERSION)}
+    for name, steps in blocks.items():
+        for stat in STATISTICS:
+            values = np.stack([step[stat] for step in steps])
+            if stat in ("mean", "area_mean"):
+                values = values.astype(np.float32)
+            arrays[f"{name}/{stat}"] = values
+
+    directory = os.path.dirname(out_path)
+    os.makedirs(directory, exist_ok=True)
+    fd, staging = tempfile.mkstemp(prefix=".tmp-", suffix=".npz", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(staging, out_path)
+    except OSError:
+        os.unlink(staging)
+        raise
+    return out_path
+
+
+class StatisticsIndex:
+    """
+    Per-slice statistics of the current data file(s), kept on disk.
+
+    Indexes live in ``directory``, named after the files they describe.
+    Missing indexes are built by a separate process, since the netCDF
+    library cannot safely be used from a second thread of the process
+    running the reader. Until the index is available, queries return None
+    and callers fall back to scanning the data.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._executor = None
+        self._pending = None
+        self._path = None
+        self._arrays = None
+
+    def open(self, data_file: str) -> None:
+        """
+        Use the index of a data file, or group of files, building it if needed.
+
+        Args:
+            data_file: Data file name or glob pattern, as given to the reader
+        """
+        # The reader needs ParaView, which the index builder does not load
+        from e3sm_quickview.plugins.eam_reader import FileSeries, file_fingerprint
+
+        self._arrays = None
+        self._pending = None
+        try:
+            # Same file grouping and identity as the reader
+            paths = FileSeries.expand(data_file)
+            key = index_key(paths, file_fingerprint)
+            self._path = os.path.join(self.directory, f"{key}.npz")
+        except OSError:
+            self._path = None
+            return
+
+        if self._load():
+            return
+
+        try:
+            if self._executor is None:
+                # Spawned workers do not inherit the state of the netCDF library
+                self._executor = ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                )
+            self._pending = self._executor.submit(build_index, paths, self._path)
+        except Exception as e:
+            print("Unable to index the data statistics :", e)
+
+    def close(self) -> None:
+        """Stop the background builds."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending = None
+
+    def _load(self) -> bool:
+        try:
+            with np.load(self._path) as npz:
+                if int(npz["version"]) != VERSION:
+                    return False
+                arrays = {key: npz[key] for key in npz.files}
+        except (OSError, ValueError, KeyError):
+            return False
+        self._arrays = arrays
+        return True
+
+    @property
+    def ready(self) -> bool:
+        """Whether the index of the current data file is available."""
+        if self._arrays is None and self._pending is not None:
+            if not self._pending.done():
+                return False
+            pending, self._pending = self._pending, None
+            if pending.exception() is not None:
+                print("Unable to index the data statistics :", pending.exception())
+                return False
+            self._load()
+        return self._arrays is not None
+
+    def lookup(
+        self, name: str, time_idx: int, level_idx: int = 0
+    ) -> Optional[Dict[str, float]]:
+        """
+        Get the statistics of a slice.
+
+        Args:
+            name: Variable name
+            time_idx: Time step, over all the files of the group
+            level_idx: Layer index, 0 for 2D variables
+
+        Returns:
+            Mapping of each statistic to its value, None when not indexed
+        """
+        if not self.ready or f"{name}/min" not in self._arrays:
+            return None
+        try:
+            return {
+                stat: self._arrays[f"{name}/{stat}"][time_idx, level_idx].item()
+                for stat in STATISTICS
+            }
+        except IndexError:
+            return None
+
+    def global_range(
+        self, name: str, level_idx: int = 0
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Get the value range of a variable layer across all time steps.
+
+        Args:
+            name: Variable name
+            level_idx: Layer index, 0 for 2D variables
+
+        Returns:
+            (min, max) over all time steps, None when not indexed
+        """
+        if not self.ready or f"{name}/min" not in self._arrays:
+            return None
+        try:
+            mins = self._arrays[f"{name}/min"][:, level_idx]
+            maxs = self._arrays[f"{name}/max"][:, level_idx]
+        except IndexError:
+            return None
+        if np.isnan(mins).all():
+            return None
+        return float(np.nanmin(mins)), float(np.nanmax(maxs))
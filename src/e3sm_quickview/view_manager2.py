@@ -45,6 +45,7 @@ TYPE_COLOR = {
     "s": "success",
     "i": "info",
     "m": "warning",
+    "n": "secondary",
 }
 
 
@@ -61,6 +62,7 @@ class ViewConfiguration(StateDataModel):
     color_value_max_valid: bool = True
     color_range: list[float] = (0, 1)
     override_range: bool = False
+    global_range: bool = False
     order: int = 0
     size: int = 4
     offset: int = 0
@@ -125,7 +127,9 @@ class VariableView(TrameComponent):
             self.color_range_str_to_float,
         )
         self.config.watch(
-            ["override_range", "color_range"], self.update_color_range, eager=True
+            ["override_range", "global_range", "color_range"],
+            self.update_color_range,
+            eager=True,
         )
         self.config.watch(
             ["preset", "invert", "use_log_scale"], self.update_color_preset, eager=True
@@ -182,6 +186,15 @@ class VariableView(TrameComponent):
         if self.config.color_value_min_valid and self.config.color_value_max_valid:
             self.config.color_range = [min_value, max_value]
 
+    def get_indexed_range(self):
+        """Data range from the statistics index, None when not indexed."""
+        if self.config.global_range:
+            return self.source.GetGlobalRange(self.variable_name)
+        stats = self.source.GetSliceStatistics(self.variable_name)
+        if stats is None or math.isnan(stats["min"]):
+            return None
+        return stats["min"], stats["max"]
+
     def update_color_range(self, *_):
         if self.config.override_range:
             skip_update = False
@@ -198,14 +211,17 @@ class VariableView(TrameComponent):
 
             self.lut.RescaleTransferFunction(*self.config.color_range)
         else:
-            self.representation.RescaleTransferFunctionToDataRange(False, True)
-            data_array = (
-                self.source.views["atmosphere_data"]
-                .GetCellDataInformation()
-                .GetArray(self.variable_name)
-            )
-            if data_array:
-                data_range = data_array.GetRange()
+            data_range = self.get_indexed_range()
+            if data_range is None:
+                self.representation.RescaleTransferFunctionToDataRange(False, True)
+                data_array = (
+                    self.source.views["atmosphere_data"]
+                    .GetCellDataInformation()
+                    .GetArray(self.variable_name)
+                )
+                if data_array:
+                    data_range = data_array.GetRange()
+            if data_range:
                 self.config.color_range = data_range
                 self.config.color_value_min = str(data_range[0])
                 self.config.color_value_max = str(data_range[1])
@@ -274,6 +290,14 @@ class VariableView(TrameComponent):
                             classes="text-caption px-1",
                             v_if="interfaces.length > 1",
                         )
+                    if self.variable_type == "n":
+                        for dim, _ in self.source.extra_dims.get(
+                            self.variable_name, []
+                        ):
+                            html.Div(
+                                f"[{dim} = {{{{ dimension_indices['{dim}'] || 0 }}}}]",
+                                classes="text-caption px-1",
+                            )
                     v3.VSpacer()
                     html.Div(
                         "avg = {{"
@@ -379,7 +403,7 @@ class ViewManager(TrameComponent):
         if n_cols == 0:
             # Auto based on group size
             if self.state.layout_grouped:
-                for var_type in "smi":
+                for var_type in "smin":
                     var_names = self._last_vars[var_type]
                     total_size = len(var_names)
 
@@ -411,7 +435,7 @@ class ViewManager(TrameComponent):
         with DivLayout(self.server, template_name="auto_layout") as self.ui:
             if self.state.layout_grouped:
                 with v3.VCol(classes="pa-1"):
-                    for var_type in "smi":
+                    for var_type in "smin":
                         var_names = variables[var_type]
                         total_size = len(var_names)
 
@@ -453,7 +477,7 @@ class ViewManager(TrameComponent):
             else:
                 all_names = [name for names in variables.values() for name in names]
                 with v3.VRow(dense=True, classes="pa-2"):
-                    for var_type in "smi":
+                    for var_type in "smin":
                         var_names = variables[var_type]
                         for name in var_names:
                             view = self.get_view(name, var_type)
@@ -489,7 +513,7 @@ class ViewManager(TrameComponent):
         existed_order = set()
         order_max = 0
         orders_to_update = []
-        for var_type in "smi":
+        for var_type in "smin":
             var_names = variables[var_type]
             for name in var_names:
                 config = self.get_view(name, var_type).config
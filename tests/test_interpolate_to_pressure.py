@@ -0,0 +1,53 @@
+import importlib.util
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("paraview")
+
+PLUGIN = os.path.join(
+    os.path.dirname(__file__),
+    os.pardir,
+    "src",
+    "e3sm_quickview",
+    "plugins",
+    "eam_reader.py",
+)
+
+
+def load_reader_plugin():
+    spec = importlib.util.spec_from_file_location("eam_reader", PLUGIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def interpolate_to_pressure():
+    return load_reader_plugin().interpolate_to_pressure
+
+
+PRESSURE = np.array([[1000.0], [5000.0], [10000.0]])
+DATA = np.array([[1.0], [2.0], [3.0]])
+
+
+def test_top_layer_pressure(interpolate_to_pressure):
+    result = interpolate_to_pressure(DATA, PRESSURE, 1000.0)
+    np.testing.assert_allclose(result, [1.0])
+
+
+def test_bottom_layer_pressure(interpolate_to_pressure):
+    result = interpolate_to_pressure(DATA, PRESSURE, 10000.0)
+    np.testing.assert_allclose(result, [3.0])
+
+
+def test_between_layers(interpolate_to_pressure):
+    target = np.sqrt(1000.0 * 5000.0)
+    result = interpolate_to_pressure(DATA, PRESSURE, target)
+    np.testing.assert_allclose(result, [1.5])
+
+
+def test_outside_of_the_column(interpolate_to_pressure):
+    assert np.isnan(interpolate_to_pressure(DATA, PRESSURE, 500.0)).all()
+    assert np.isnan(interpolate_to_pressure(DATA, PRESSURE, 20000.0)).all()